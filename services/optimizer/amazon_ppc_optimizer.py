@@ -31,27 +31,41 @@ Usage:
 
 import argparse
 import csv
+import hashlib
 import io
 import json
 import logging
 import os
 import sys
+import tempfile
+import threading
 import time
 import zipfile
 from collections import defaultdict
-from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Set
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Set
 import gzip
 import traceback
 
+import numpy as np
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     from google.cloud import secretmanager  # type: ignore
 except ImportError:  # pragma: no cover - optional dependency
     secretmanager = None
 
+try:  # Optional fast JSON codec
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 try:
     import yaml
 except ImportError:
@@ -71,10 +85,57 @@ ENDPOINTS = {
 TOKEN_URL = "https://api.amazon.com/auth/o2/token"
 USER_AGENT = "NWS-PPC-Automation/2.0"
 
+# Access tokens are cached on disk so repeated invocations skip the OAuth call
+TOKEN_CACHE_FILE = os.getenv(
+    "PPC_TOKEN_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "nws_ppc", "token.json"),
+)
+
 # Rate limiting
 MAX_REQUESTS_PER_SECOND = 5
 REQUEST_INTERVAL = 1.0 / MAX_REQUESTS_PER_SECOND
 
+# Connection pooling
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 32
+
+# Concurrent API calls (bounded by the rate limiter)
+MAX_WORKERS = 4
+
+# Maximum entities accepted by a single bulk create/update request
+API_BATCH_SIZE = 1000
+
+# Report archive signatures
+ZIP_MAGIC = b'PK\x03\x04'
+GZIP_MAGIC = b'\x1f\x8b'
+
+# Report polling backoff (seconds)
+REPORT_POLL_INITIAL_DELAY = 1.0
+REPORT_POLL_MAX_DELAY = 15.0
+REPORT_POLL_BACKOFF = 1.5
+
+# Report definitions: (report type, metrics, segment)
+KEYWORD_REPORT_METRICS = ('campaignId', 'adGroupId', 'keywordId', 'impressions', 'clicks',
+                          'cost', 'attributedSales14d', 'attributedConversions14d')
+CAMPAIGN_REPORT_METRICS = ('campaignId', 'impressions', 'clicks', 'cost',
+                           'attributedSales14d', 'attributedConversions14d')
+SEARCH_TERM_REPORT_METRICS = ('campaignId', 'adGroupId', 'query', 'impressions', 'clicks',
+                              'cost', 'attributedSales14d', 'attributedConversions14d')
+
+REPORT_METRIC_COLUMNS = ('impressions', 'clicks', 'cost',
+                         'attributedSales14d', 'attributedConversions14d')
+
+FEATURE_REPORTS = {
+    'bid_optimization': ('keywords', KEYWORD_REPORT_METRICS, None),
+    'campaign_management': ('campaigns', CAMPAIGN_REPORT_METRICS, None),
+    'keyword_discovery': ('targets', SEARCH_TERM_REPORT_METRICS, 'query'),
+    'negative_keywords': ('targets', SEARCH_TERM_REPORT_METRICS, 'query'),
+}
+
+# Audit trail CSV columns, in write order
+AUDIT_FIELDNAMES = ('timestamp', 'action_type', 'entity_type', 'entity_id',
+                    'old_value', 'new_value', 'reason', 'dry_run')
+
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
@@ -172,6 +233,77 @@ def get_runtime_secret(env_key: str, default: Optional[str] = None) -> Optional[
         return default
 
 
+# ============================================================================
+# HTTP SESSION
+# ============================================================================
+
+def _json_loads(data: bytes):
+    """Decode a JSON response body, using orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode a JSON request body, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _build_session() -> requests.Session:
+    """Create a pooled keep-alive session shared by all API calls."""
+    session = requests.Session()
+    # Only connection-level failures are retried here. _request owns the
+    # 429/5xx handling; retrying statuses here too would multiply attempts
+    # and honour Retry-After twice against the rate-limited Ads API
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=3,
+        status=0,
+        backoff_factor=0.3,
+        respect_retry_after_header=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept": "application/json",
+    })
+    return session
+
+
+_SESSION = _build_session()
+
+
+def default_report_date() -> str:
+    """Report date used when none is given: yesterday, as YYYYMMDD"""
+    return (datetime.now() - timedelta(days=1)).strftime('%Y%m%d')
+
+
+def run_batches(func, items: List, batch_size: int = API_BATCH_SIZE,
+                max_workers: int = MAX_WORKERS) -> List:
+    """Call func on each batch of items concurrently and return the results in order"""
+    batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    if not batches:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+        return list(executor.map(func, batches))
+
+
+def run_concurrently(*calls) -> List:
+    """Run independent zero-argument calls on threads and return their results in order"""
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
@@ -220,43 +352,141 @@ class Keyword:
     bid: float
 
 
-@dataclass
-class PerformanceMetrics:
-    """Performance metrics for keywords/campaigns"""
-    impressions: int = 0
-    clicks: int = 0
-    cost: float = 0.0
-    sales: float = 0.0
-    orders: int = 0
+def _rules_from_config(cls, config, section: str):
+    """Resolve every field of a rules dataclass from one config section"""
+    return cls(**{
+        f.name: type(f.default)(config.get(f'{section}.{f.name}', f.default))
+        for f in fields(cls)
+    })
+
+
+@dataclass(frozen=True, slots=True)
+class BidRules:
+    """Bid optimization thresholds resolved once per run"""
+    min_clicks: float = 25.0
+    min_spend: float = 5.0
+    high_acos: float = 0.60
+    low_acos: float = 0.25
+    up_pct: float = 0.15
+    down_pct: float = 0.20
+    min_bid: float = 0.25
+    max_bid: float = 5.0
     
-    @property
-    def ctr(self) -> float:
-        return (self.clicks / self.impressions) if self.impressions > 0 else 0.0
+    @classmethod
+    def from_config(cls, config) -> 'BidRules':
+        return _rules_from_config(cls, config, 'bid_optimization')
+
+
+@dataclass(frozen=True, slots=True)
+class DaypartingRules:
+    """Dayparting multipliers and clamps resolved once per run"""
+    day_multipliers: dict = field(default_factory=dict)
+    hour_multipliers: dict = field(default_factory=dict)
+    min_multiplier: float = 0.4
+    max_multiplier: float = 1.8
     
-    @property
-    def acos(self) -> float:
-        return (self.cost / self.sales) if self.sales > 0 else float('inf')
+    @classmethod
+    def from_config(cls, config) -> 'DaypartingRules':
+        return cls(
+            day_multipliers=config.get('dayparting.day_multipliers', {}),
+            hour_multipliers=config.get('dayparting.hour_multipliers', {}),
+            min_multiplier=float(config.get('dayparting.min_multiplier', 0.4)),
+            max_multiplier=float(config.get('dayparting.max_multiplier', 1.8)),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CampaignRules:
+    """Campaign activation/pause thresholds resolved once per run"""
+    acos_threshold: float = 0.45
+    min_spend: float = 20.0
     
-    @property
-    def roas(self) -> float:
-        return (self.sales / self.cost) if self.cost > 0 else 0.0
+    @classmethod
+    def from_config(cls, config) -> 'CampaignRules':
+        return _rules_from_config(cls, config, 'campaign_management')
+
+
+@dataclass(frozen=True, slots=True)
+class KeywordDiscoveryRules:
+    """Search term harvesting thresholds resolved once per run"""
+    min_clicks: int = 5
+    max_acos: float = 0.40
+    initial_bid: float = 0.75
     
-    @property
-    def cpc(self) -> float:
-        return (self.cost / self.clicks) if self.clicks > 0 else 0.0
+    @classmethod
+    def from_config(cls, config) -> 'KeywordDiscoveryRules':
+        return _rules_from_config(cls, config, 'keyword_discovery')
 
 
-@dataclass
-class AuditEntry:
-    """Audit trail entry"""
-    timestamp: str
-    action_type: str
-    entity_type: str
-    entity_id: str
-    old_value: str
-    new_value: str
-    reason: str
-    dry_run: bool
+@dataclass(frozen=True, slots=True)
+class NegativeKeywordRules:
+    """Negative keyword thresholds resolved once per run"""
+    min_spend: float = 10.0
+    max_acos: float = 1.0
+    
+    @classmethod
+    def from_config(cls, config) -> 'NegativeKeywordRules':
+        return _rules_from_config(cls, config, 'negative_keywords')
+
+
+# ============================================================================
+# TOKEN CACHE
+# ============================================================================
+
+def _auth_cache_key(client_id: str, client_secret: str, refresh_token: str) -> str:
+    """Hash of every credential, so a token is only reused for the exact same ones"""
+    material = '\0'.join((client_id, client_secret, refresh_token))
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+def _load_cached_auth(cache_key: str) -> Optional[Auth]:
+    """Return the cached access token for cache_key if it is still valid"""
+    try:
+        with open(TOKEN_CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(data, dict) or data.get('key') != cache_key:
+        return None
+    
+    try:
+        auth = Auth(
+            access_token=data['access_token'],
+            token_type=data.get('token_type', 'Bearer'),
+            expires_at=float(data['expires_at'])
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+    
+    return None if auth.is_expired() else auth
+
+
+def _store_cached_auth(cache_key: str, auth: Auth) -> None:
+    """Persist the access token with owner-only permissions"""
+    cache_dir = os.path.dirname(TOKEN_CACHE_FILE) or '.'
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        # A unique temp file per writer (created 0600) keeps concurrent refreshes
+        # from interleaving; os.replace then swaps it in atomically
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_dir,
+                                         prefix='.token-', suffix='.tmp', delete=False) as f:
+            tmp_path = f.name
+            json.dump({
+                'key': cache_key,
+                'access_token': auth.access_token,
+                'token_type': auth.token_type,
+                'expires_at': auth.expires_at,
+            }, f)
+        os.replace(tmp_path, TOKEN_CACHE_FILE)
+    except OSError as e:
+        logger.debug(f"Could not write token cache {TOKEN_CACHE_FILE}: {e}")
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
 
 # ============================================================================
@@ -264,23 +494,25 @@ class AuditEntry:
 # ============================================================================
 
 class RateLimiter:
-    """Simple rate limiter for API calls"""
+    """Simple thread-safe rate limiter for API calls"""
     
     def __init__(self, max_per_second: int = MAX_REQUESTS_PER_SECOND):
         self.max_per_second = max_per_second
         self.interval = 1.0 / max_per_second
         self.last_request_time = 0.0
+        self._lock = threading.Lock()
     
     def wait_if_needed(self):
         """Wait if necessary to respect rate limits"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.interval:
-            sleep_time = self.interval - time_since_last
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        with self._lock:
+            current_time = time.time()
+            time_since_last = current_time - self.last_request_time
+            
+            if time_since_last < self.interval:
+                sleep_time = self.interval - time_since_last
+                time.sleep(sleep_time)
+            
+            self.last_request_time = time.time()
 
 
 # ============================================================================
@@ -293,6 +525,7 @@ class Config:
     def __init__(self, config_path: str):
         self.config_path = config_path
         self.data = self._load_config()
+        self._resolved: Dict[str, object] = {}
     
     def _load_config(self) -> Dict:
         """Load configuration from YAML file"""
@@ -307,18 +540,26 @@ class Config:
     
     def get(self, key: str, default=None):
         """Get configuration value with dot notation support"""
-        keys = key.split('.')
+        # Config is read-only after load, so each dotted path is walked once
+        try:
+            value = self._resolved[key]
+        except KeyError:
+            value = self._resolved[key] = self._lookup(key)
+        
+        return value if value is not None else default
+    
+    def _lookup(self, key: str):
+        """Walk the dotted path, returning None when any segment is missing"""
         value = self.data
         
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
+        for k in key.split('.'):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(k)
+            if value is None:
+                return None
         
-        return value if value is not None else default
+        return value
 
 
 # ============================================================================
@@ -330,55 +571,62 @@ class AuditLogger:
     
     def __init__(self, output_dir: str = "."):
         self.output_dir = output_dir
+        self._file = None
+        self._writer = None
+        self.start_run()
+    
+    def start_run(self):
+        """Begin a fresh audit file whose entries share the run's start time"""
+        # Microseconds keep back-to-back runs of a reused instance from
+        # truncating each other's audit file
         self.filename = os.path.join(
-            output_dir,
-            f"ppc_audit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            self.output_dir,
+            f"ppc_audit_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.csv"
         )
-        self.entries: List[AuditEntry] = []
+        self.entry_count = 0
+        self.run_timestamp = datetime.utcnow().isoformat()
+    
+    def _open(self):
+        """Open the audit CSV and write its header on the first entry"""
+        self._file = open(self.filename, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(AUDIT_FIELDNAMES)
     
     def log(self, action_type: str, entity_type: str, entity_id: str,
             old_value: str, new_value: str, reason: str, dry_run: bool = False):
-        """Log an audit entry"""
-        entry = AuditEntry(
-            timestamp=datetime.utcnow().isoformat(),
-            action_type=action_type,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            old_value=old_value,
-            new_value=new_value,
-            reason=reason,
-            dry_run=dry_run
-        )
-        self.entries.append(entry)
+        """Log an audit entry, streaming it straight to the CSV"""
+        try:
+            if self._writer is None:
+                self._open()
+            
+            self._writer.writerow((
+                self.run_timestamp,
+                action_type,
+                entity_type,
+                entity_id,
+                old_value,
+                new_value,
+                reason,
+                dry_run
+            ))
+            self.entry_count += 1
+        except Exception as e:
+            logger.error(f"Failed to write audit entry: {e}")
     
     def save(self):
-        """Save audit trail to CSV"""
-        if not self.entries:
+        """Flush and close the audit trail CSV"""
+        if self._file is None:
             logger.info("No audit entries to save")
             return
         
         try:
-            with open(self.filename, 'w', newline='', encoding='utf-8') as f:
-                fieldnames = ['timestamp', 'action_type', 'entity_type', 'entity_id',
-                             'old_value', 'new_value', 'reason', 'dry_run']
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for entry in self.entries:
-                    writer.writerow({
-                        'timestamp': entry.timestamp,
-                        'action_type': entry.action_type,
-                        'entity_type': entry.entity_type,
-                        'entity_id': entry.entity_id,
-                        'old_value': entry.old_value,
-                        'new_value': entry.new_value,
-                        'reason': entry.reason,
-                        'dry_run': entry.dry_run
-                    })
-            
-            logger.info(f"Audit trail saved to {self.filename} ({len(self.entries)} entries)")
+            self._file.close()
+            logger.info(f"Audit trail saved to {self.filename} ({self.entry_count} entries)")
         except Exception as e:
             logger.error(f"Failed to save audit trail: {e}")
+        finally:
+            self._file = None
+            self._writer = None
 
 
 # ============================================================================
@@ -404,11 +652,24 @@ class AmazonAdsAPI:
             )
             sys.exit(1)
 
+        self._auth_cache_key = _auth_cache_key(self.client_id, self.client_secret, self.refresh_token)
         self.auth = self._authenticate()
+        # Report threads share this client; only one of them may refresh the token
+        self._auth_lock = threading.RLock()
         self.rate_limiter = RateLimiter()
+        self._report_futures: Dict[Tuple, Future] = {}
+        self._report_executors: List[ThreadPoolExecutor] = []
+        self._report_cancel = threading.Event()
+        self._cached_headers: Optional[Mapping[str, str]] = None
+        self._cached_headers_token: Optional[str] = None
     
     def _authenticate(self) -> Auth:
         """Authenticate and get access token"""
+        cached = _load_cached_auth(self._auth_cache_key)
+        if cached is not None:
+            logger.info("Using cached Amazon Ads API access token")
+            return cached
+        
         payload = {
             "grant_type": "refresh_token",
             "refresh_token": self.refresh_token,
@@ -417,9 +678,9 @@ class AmazonAdsAPI:
         }
         
         try:
-            response = requests.post(TOKEN_URL, data=payload, timeout=30)
+            response = _SESSION.post(TOKEN_URL, data=payload, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             
             auth = Auth(
                 access_token=data["access_token"],
@@ -427,6 +688,7 @@ class AmazonAdsAPI:
                 expires_at=time.time() + int(data.get("expires_in", 3600))
             )
             logger.info("Successfully authenticated with Amazon Ads API")
+            _store_cached_auth(self._auth_cache_key, auth)
             return auth
         except Exception as e:
             logger.error(f"Authentication failed: {e}")
@@ -434,22 +696,27 @@ class AmazonAdsAPI:
     
     def _refresh_auth_if_needed(self):
         """Refresh authentication if token expired"""
-        if self.auth.is_expired():
-            logger.info("Access token expired, refreshing...")
-            self.auth = self._authenticate()
-    
-    def _headers(self) -> Dict[str, str]:
-        """Get API request headers"""
-        self._refresh_auth_if_needed()
-        
-        return {
-            "Authorization": f"{self.auth.token_type} {self.auth.access_token}",
-            "Content-Type": "application/json",
-            "Amazon-Advertising-API-ClientId": self.client_id,
-            "Amazon-Advertising-API-Scope": self.profile_id,
-            "User-Agent": USER_AGENT,
-            "Accept": "application/json",
-        }
+        with self._auth_lock:
+            # Threads that waited on the lock see the token the first one fetched
+            if self.auth.is_expired():
+                logger.info("Access token expired, refreshing...")
+                self.auth = self._authenticate()
+    
+    def _headers(self) -> Mapping[str, str]:
+        """Get API request headers, rebuilt only when the access token changes"""
+        with self._auth_lock:
+            self._refresh_auth_if_needed()
+            
+            if self._cached_headers_token != self.auth.access_token:
+                self._cached_headers = MappingProxyType({
+                    "Authorization": f"{self.auth.token_type} {self.auth.access_token}",
+                    "Content-Type": "application/json",
+                    "Amazon-Advertising-API-ClientId": self.client_id,
+                    "Amazon-Advertising-API-Scope": self.profile_id,
+                })
+                self._cached_headers_token = self.auth.access_token
+            
+            return self._cached_headers
     
     def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make API request with retry logic and rate limiting"""
@@ -459,9 +726,13 @@ class AmazonAdsAPI:
         max_retries = 3
         retry_delay = 1
         
+        # Encode JSON bodies ourselves; Content-Type is set by _headers
+        if 'json' in kwargs:
+            kwargs['data'] = _json_dumps(kwargs.pop('json'))
+        
         for attempt in range(max_retries):
             try:
-                response = requests.request(
+                response = _SESSION.request(
                     method=method,
                     url=url,
                     headers=self._headers(),
@@ -499,7 +770,7 @@ class AmazonAdsAPI:
                 params['stateFilter'] = state_filter
             
             response = self._request('GET', '/v2/sp/campaigns', params=params)
-            campaigns_data = response.json()
+            campaigns_data = _json_loads(response.content)
             
             campaigns = []
             for c in campaigns_data:
@@ -519,25 +790,26 @@ class AmazonAdsAPI:
             logger.error(f"Failed to get campaigns: {e}")
             return []
     
-    def update_campaign(self, campaign_id: str, updates: Dict) -> bool:
-        """Update campaign settings"""
+    def update_campaigns(self, updates: List[Dict]) -> int:
+        """Update campaigns in bulk and return the number updated"""
+        updated = sum(run_batches(self._update_campaign_batch, updates))
+        logger.info(f"Updated {updated} campaigns")
+        return updated
+    
+    def _update_campaign_batch(self, batch: List[Dict]) -> int:
+        """PUT one batch of campaign updates"""
         try:
-            response = self._request(
-                'PUT',
-                f'/v2/sp/campaigns/{campaign_id}',
-                json=updates
-            )
-            logger.info(f"Updated campaign {campaign_id}")
-            return True
+            response = self._request('PUT', '/v2/sp/campaigns', json=batch)
+            return sum(1 for r in _json_loads(response.content) if r.get('code') == 'SUCCESS')
         except Exception as e:
-            logger.error(f"Failed to update campaign {campaign_id}: {e}")
-            return False
+            logger.error(f"Failed to update {len(batch)} campaigns: {e}")
+            return 0
     
     def create_campaign(self, campaign_data: Dict) -> Optional[str]:
         """Create new campaign"""
         try:
             response = self._request('POST', '/v2/sp/campaigns', json=[campaign_data])
-            result = response.json()
+            result = _json_loads(response.content)
             
             if result and len(result) > 0:
                 campaign_id = result[0].get('campaignId')
@@ -560,7 +832,7 @@ class AmazonAdsAPI:
                 params['campaignIdFilter'] = campaign_id
             
             response = self._request('GET', '/v2/sp/adGroups', params=params)
-            ad_groups_data = response.json()
+            ad_groups_data = _json_loads(response.content)
             
             ad_groups = []
             for ag in ad_groups_data:
@@ -583,7 +855,7 @@ class AmazonAdsAPI:
         """Create new ad group"""
         try:
             response = self._request('POST', '/v2/sp/adGroups', json=[ad_group_data])
-            result = response.json()
+            result = _json_loads(response.content)
             
             if result and len(result) > 0:
                 ad_group_id = result[0].get('adGroupId')
@@ -608,7 +880,7 @@ class AmazonAdsAPI:
                 params['adGroupIdFilter'] = ad_group_id
             
             response = self._request('GET', '/v2/sp/keywords', params=params)
-            keywords_data = response.json()
+            keywords_data = _json_loads(response.content)
             
             keywords = []
             for kw in keywords_data:
@@ -629,25 +901,26 @@ class AmazonAdsAPI:
             logger.error(f"Failed to get keywords: {e}")
             return []
     
-    def update_keyword_bid(self, keyword_id: str, bid: float, state: str = None) -> bool:
-        """Update keyword bid"""
+    def update_keyword_bids(self, updates: List[Dict]) -> int:
+        """Update keyword bids in bulk and return the number updated"""
+        updated = sum(run_batches(self._update_keyword_batch, updates))
+        logger.info(f"Updated {updated} keyword bids")
+        return updated
+    
+    def _update_keyword_batch(self, batch: List[Dict]) -> int:
+        """PUT one batch of keyword updates"""
         try:
-            updates = {'keywordId': int(keyword_id), 'bid': round(bid, 2)}
-            if state:
-                updates['state'] = state
-            
-            response = self._request('PUT', '/v2/sp/keywords', json=[updates])
-            logger.debug(f"Updated keyword {keyword_id} bid to ${bid:.2f}")
-            return True
+            response = self._request('PUT', '/v2/sp/keywords', json=batch)
+            return sum(1 for r in _json_loads(response.content) if r.get('code') == 'SUCCESS')
         except Exception as e:
-            logger.error(f"Failed to update keyword {keyword_id}: {e}")
-            return False
+            logger.error(f"Failed to update {len(batch)} keywords: {e}")
+            return 0
     
     def create_keywords(self, keywords_data: List[Dict]) -> List[str]:
         """Create new keywords"""
         try:
             response = self._request('POST', '/v2/sp/keywords', json=keywords_data)
-            result = response.json()
+            result = _json_loads(response.content)
             
             created_ids = []
             for r in result:
@@ -672,7 +945,7 @@ class AmazonAdsAPI:
                 params['campaignIdFilter'] = campaign_id
             
             response = self._request('GET', '/v2/sp/negativeKeywords', params=params)
-            return response.json()
+            return _json_loads(response.content)
         except Exception as e:
             logger.error(f"Failed to get negative keywords: {e}")
             return []
@@ -681,7 +954,7 @@ class AmazonAdsAPI:
         """Create negative keywords"""
         try:
             response = self._request('POST', '/v2/sp/negativeKeywords', json=negative_keywords_data)
-            result = response.json()
+            result = _json_loads(response.content)
             
             created_ids = []
             for r in result:
@@ -698,12 +971,12 @@ class AmazonAdsAPI:
     # REPORTS
     # ========================================================================
     
-    def create_report(self, report_type: str, metrics: List[str], 
+    def create_report(self, report_type: str, metrics: Tuple[str, ...], 
                      report_date: str = None, segment: str = None) -> Optional[str]:
         """Create performance report"""
         try:
             if report_date is None:
-                report_date = (datetime.now() - timedelta(days=1)).strftime('%Y%m%d')
+                report_date = default_report_date()
             
             payload = {
                 'reportDate': report_date,
@@ -715,7 +988,7 @@ class AmazonAdsAPI:
             
             endpoint = f'/v2/sp/{report_type}/report'
             response = self._request('POST', endpoint, json=payload)
-            report_id = response.json().get('reportId')
+            report_id = _json_loads(response.content).get('reportId')
             
             logger.info(f"Created report {report_id} (type: {report_type})")
             return report_id
@@ -727,46 +1000,48 @@ class AmazonAdsAPI:
         """Get report status"""
         try:
             response = self._request('GET', f'/v2/reports/{report_id}')
-            return response.json()
+            return _json_loads(response.content)
         except Exception as e:
             logger.error(f"Failed to get report status: {e}")
             return {}
     
-    def download_report(self, report_url: str) -> List[Dict]:
-        """Download and parse report"""
-        try:
-            response = requests.get(report_url, timeout=60)
+    def read_report_frame(self, report_url: str) -> pd.DataFrame:
+        """Stream a report download straight into a column-oriented frame"""
+        with _SESSION.get(report_url, stream=True, timeout=60) as response:
             response.raise_for_status()
-            
-            # Try to decompress as gzip or zip
-            content = response.content
-            
-            try:
-                # Try ZIP format first
-                with zipfile.ZipFile(io.BytesIO(content)) as z:
+            response.raw.decode_content = True
+            # urllib3 closes the raw stream at EOF by default, which makes the
+            # BufferedReader wrapper fail its final read; the with block closes it
+            response.raw.auto_close = False
+            stream = io.BufferedReader(response.raw)
+            magic = stream.peek(4)[:4]
+            
+            if magic.startswith(ZIP_MAGIC):
+                # ZIP needs random access to its central directory
+                with zipfile.ZipFile(io.BytesIO(stream.read())) as z:
                     names = z.namelist()
                     with z.open(names[0]) as f:
-                        text = io.TextIOWrapper(f, encoding='utf-8', newline='')
-                        return list(csv.DictReader(text))
-            except zipfile.BadZipFile:
-                # Try GZIP format
-                try:
-                    with gzip.GzipFile(fileobj=io.BytesIO(content)) as gz:
-                        text = io.TextIOWrapper(gz, encoding='utf-8', newline='')
-                        return list(csv.DictReader(text))
-                except Exception:
-                    # Try as plain text
-                    text = io.StringIO(content.decode('utf-8'))
-                    return list(csv.DictReader(text))
+                        return _read_report_csv(f)
+            
+            if magic.startswith(GZIP_MAGIC):
+                stream = gzip.GzipFile(fileobj=stream)
+            
+            return _read_report_csv(stream)
+    
+    def download_report(self, report_url: str) -> pd.DataFrame:
+        """Download and parse report"""
+        try:
+            return self.read_report_frame(report_url)
         except Exception as e:
             logger.error(f"Failed to download report: {e}")
-            return []
+            return pd.DataFrame()
     
     def wait_for_report(self, report_id: str, timeout: int = 300) -> Optional[str]:
         """Wait for report to be ready and return download URL"""
-        start_time = time.time()
+        deadline = time.time() + timeout
+        delay = REPORT_POLL_INITIAL_DELAY
         
-        while time.time() - start_time < timeout:
+        while time.time() < deadline:
             status_data = self.get_report_status(report_id)
             status = status_data.get('status')
             
@@ -776,11 +1051,59 @@ class AmazonAdsAPI:
                 logger.error(f"Report {report_id} failed: {status}")
                 return None
             
-            time.sleep(5)
+            # Poll quickly at first, then back off for slow reports
+            if self._report_cancel.wait(min(delay, max(0.0, deadline - time.time()))):
+                logger.info(f"Stopped waiting for report {report_id}: run ended")
+                return None
+            delay = min(delay * REPORT_POLL_BACKOFF, REPORT_POLL_MAX_DELAY)
         
         logger.error(f"Report {report_id} timeout")
         return None
     
+    def _fetch_report(self, report_type: str, metrics: Tuple[str, ...],
+                      segment: str = None, report_date: str = None) -> Optional[pd.DataFrame]:
+        """Create a report, wait for it and download it"""
+        report_id = self.create_report(report_type, metrics, report_date=report_date, segment=segment)
+        if not report_id:
+            return None
+        
+        report_url = self.wait_for_report(report_id)
+        if not report_url:
+            return None
+        
+        return self.download_report(report_url)
+    
+    def prefetch_reports(self, specs) -> None:
+        """Request and poll several reports concurrently"""
+        pending = [spec for spec in dict.fromkeys(specs) if spec not in self._report_futures]
+        if not pending:
+            return
+        
+        # Every report in a run covers the same day, even across midnight
+        report_date = default_report_date()
+        executor = ThreadPoolExecutor(max_workers=len(pending))
+        self._report_executors.append(executor)
+        for spec in pending:
+            self._report_futures[spec] = executor.submit(self._fetch_report, *spec, report_date)
+    
+    def fetch_report(self, report_type: str, metrics: Tuple[str, ...],
+                     segment: str = None) -> Optional[pd.DataFrame]:
+        """Return a report frame, reusing a prefetched report when available"""
+        future = self._report_futures.get((report_type, metrics, segment))
+        if future is not None:
+            return future.result()
+        return self._fetch_report(report_type, metrics, segment)
+    
+    def clear_report_cache(self) -> None:
+        """Stop any report polling still running and drop prefetched reports"""
+        # After a failed run, unconsumed reports may still be polling the API
+        self._report_cancel.set()
+        for executor in self._report_executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+        self._report_executors.clear()
+        self._report_futures.clear()
+        self._report_cancel.clear()
+    
     # ========================================================================
     # KEYWORD SUGGESTIONS
     # ========================================================================
@@ -795,7 +1118,7 @@ class AmazonAdsAPI:
             }
             
             response = self._request('POST', '/v2/sp/targets/keywords/recommendations', json=payload)
-            recommendations = response.json()
+            recommendations = _json_loads(response.content)
             
             suggested_keywords = []
             if 'recommendations' in recommendations:
@@ -813,6 +1136,75 @@ class AmazonAdsAPI:
             return []
 
 
+# ============================================================================
+# PERFORMANCE FRAMES
+# ============================================================================
+
+def _read_report_csv(stream) -> pd.DataFrame:
+    """Parse report CSV columns as raw strings, as csv.reader would"""
+    # keep_default_na=False stops search terms like "null" or "NA" becoming NaN
+    return pd.read_csv(stream, dtype=str, keep_default_na=False, encoding='utf-8')
+
+
+def load_report_frame(report: pd.DataFrame, id_columns: Tuple[str, ...] = ()) -> pd.DataFrame:
+    """Return a copy of a report with string IDs and numeric metric columns"""
+    frame = report.copy()
+    
+    for column in id_columns:
+        frame[column] = frame[column].fillna('').astype(str) if column in frame else ''
+    
+    for column in REPORT_METRIC_COLUMNS:
+        if column in frame:
+            frame[column] = pd.to_numeric(frame[column], errors='coerce').fillna(0.0)
+        else:
+            frame[column] = 0.0
+    
+    return frame
+
+
+def add_kpi_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    """Return a copy of frame with vectorized CTR and ACOS columns"""
+    impressions = frame['impressions'].to_numpy(dtype=float)
+    clicks = frame['clicks'].to_numpy(dtype=float)
+    cost = frame['cost'].to_numpy(dtype=float)
+    sales = frame['attributedSales14d'].to_numpy(dtype=float)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return frame.assign(
+            ctr=np.where(impressions > 0, clicks / impressions, 0.0),
+            acos=np.where(sales > 0, cost / sales, np.inf),
+        )
+
+
+def round_bids(bids: np.ndarray) -> np.ndarray:
+    """Round bids to cents exactly as round(bid, 2) does, keeping NaN as NaN"""
+    # np.round scales by 100 before rounding, which lands some half-cent
+    # values one cent away from Python's correctly rounded result
+    rounded = bids.copy()
+    present = ~np.isnan(bids)
+    rounded[present] = [round(bid, 2) for bid in bids[present].tolist()]
+    return rounded
+
+
+def decide_bid_changes(rules: BidRules, frame: pd.DataFrame, current_bids: np.ndarray) -> np.ndarray:
+    """Vectorized bid decision; returns new bids with NaN where no change applies"""
+    clicks = frame['clicks'].to_numpy(dtype=float)
+    cost = frame['cost'].to_numpy(dtype=float)
+    sales = frame['attributedSales14d'].to_numpy(dtype=float)
+    acos = frame['acos'].to_numpy(dtype=float)
+    
+    # Only keywords with enough data are eligible for a change
+    enough_data = (clicks >= rules.min_clicks) | (cost >= rules.min_spend)
+    # No sales or high ACOS - reduce bid
+    down_mask = enough_data & (((sales <= 0) & (clicks >= rules.min_clicks)) | (acos > rules.high_acos))
+    # Low ACOS - increase bid
+    up_mask = enough_data & ~down_mask & (acos < rules.low_acos) & (sales > 0)
+    
+    factor = np.where(down_mask, 1 - rules.down_pct, np.where(up_mask, 1 + rules.up_pct, np.nan))
+    new_bids = np.clip(current_bids * factor, rules.min_bid, rules.max_bid)
+    return round_bids(new_bids)
+
+
 # ============================================================================
 # AUTOMATION FEATURES
 # ============================================================================
@@ -836,125 +1228,84 @@ class BidOptimizer:
             'no_change': 0
         }
         
-        # Get performance data
-        lookback_days = self.config.get('bid_optimization.lookback_days', 14)
-        report_id = self.api.create_report(
-            'keywords',
-            ['campaignId', 'adGroupId', 'keywordId', 'impressions', 'clicks', 
-             'cost', 'attributedSales14d', 'attributedConversions14d'],
-            report_date=(datetime.now() - timedelta(days=1)).strftime('%Y%m%d')
+        # Get performance data and current keywords concurrently
+        report_data, keywords = run_concurrently(
+            lambda: self.api.fetch_report(*FEATURE_REPORTS['bid_optimization']),
+            self.api.get_keywords
         )
-        
-        if not report_id:
-            logger.error("Failed to create performance report")
+        if report_data is None:
+            logger.error("Failed to get performance report data")
             return results
         
-        report_url = self.api.wait_for_report(report_id)
-        if not report_url:
-            logger.error("Failed to get report data")
-            return results
+        keyword_map = {kw.keyword_id: kw for kw in keywords}
         
-        report_data = self.api.download_report(report_url)
+        # Resolve thresholds once instead of per keyword
+        rules = BidRules.from_config(self.config)
         
-        # Get current keywords
-        keywords = self.api.get_keywords()
-        keyword_map = {kw.keyword_id: kw for kw in keywords}
+        frame = load_report_frame(report_data, id_columns=('keywordId',))
+        frame = frame[frame['keywordId'].isin(list(keyword_map))]
+        keywords_analyzed = len(frame)
         
-        # Analyze each keyword
-        for row in report_data:
-            keyword_id = row.get('keywordId')
-            if not keyword_id or keyword_id not in keyword_map:
-                continue
+        # Drop keywords without enough data before any KPI math, then
+        # compute CTR/ACOS for the rest in one vectorized pass
+        sufficient = (frame['clicks'] >= rules.min_clicks) | (frame['cost'] >= rules.min_spend)
+        frame = add_kpi_columns(frame[sufficient])
+        current_bids = np.fromiter(
+            (keyword_map[keyword_id].bid for keyword_id in frame['keywordId']),
+            dtype=float, count=len(frame)
+        )
+        
+        # Decide every bid at once and only walk the keywords that change
+        new_bids = decide_bid_changes(rules, frame, current_bids)
+        with np.errstate(invalid='ignore'):
+            changed = np.abs(new_bids - current_bids) > 0.01
+        
+        results['keywords_analyzed'] = keywords_analyzed
+        results['no_change'] = keywords_analyzed - int(changed.sum())
+        bid_updates = []
+        
+        for row, old_bid, new_bid in zip(frame[changed].itertuples(index=False),
+                                         current_bids[changed], new_bids[changed]):
+            keyword_id = row.keywordId
+            new_bid = float(new_bid)
+            reason = self._get_bid_change_reason(
+                rules, row.clicks, row.attributedSales14d, row.ctr, row.acos
+            )
             
-            results['keywords_analyzed'] += 1
-            keyword = keyword_map[keyword_id]
+            if new_bid > old_bid:
+                results['bids_increased'] += 1
+            else:
+                results['bids_decreased'] += 1
             
-            # Calculate metrics
-            metrics = PerformanceMetrics(
-                impressions=int(row.get('impressions', 0) or 0),
-                clicks=int(row.get('clicks', 0) or 0),
-                cost=float(row.get('cost', 0) or 0),
-                sales=float(row.get('attributedSales14d', 0) or 0),
-                orders=int(row.get('attributedConversions14d', 0) or 0)
+            self.audit.log(
+                'BID_UPDATE',
+                'KEYWORD',
+                keyword_id,
+                f"${old_bid:.2f}",
+                f"${new_bid:.2f}",
+                reason,
+                dry_run
             )
             
-            # Determine bid change
-            new_bid = self._calculate_new_bid(keyword, metrics)
-            
-            if new_bid and abs(new_bid - keyword.bid) > 0.01:
-                reason = self._get_bid_change_reason(keyword, metrics, new_bid)
-                
-                if new_bid > keyword.bid:
-                    results['bids_increased'] += 1
-                else:
-                    results['bids_decreased'] += 1
-                
-                self.audit.log(
-                    'BID_UPDATE',
-                    'KEYWORD',
-                    keyword_id,
-                    f"${keyword.bid:.2f}",
-                    f"${new_bid:.2f}",
-                    reason,
-                    dry_run
-                )
-                
-                if not dry_run:
-                    self.api.update_keyword_bid(keyword_id, new_bid)
-            else:
-                results['no_change'] += 1
+            bid_updates.append({'keywordId': int(keyword_id), 'bid': new_bid})
+        
+        if bid_updates and not dry_run:
+            self.api.update_keyword_bids(bid_updates)
         
         logger.info(f"Bid optimization complete: {results}")
         return results
     
-    def _calculate_new_bid(self, keyword: Keyword, metrics: PerformanceMetrics) -> Optional[float]:
-        """Calculate new bid based on performance"""
-        # Get thresholds from config
-        min_clicks = self.config.get('bid_optimization.min_clicks', 25)
-        min_spend = self.config.get('bid_optimization.min_spend', 5.0)
-        target_acos = self.config.get('bid_optimization.target_acos', 0.45)
-        high_acos = self.config.get('bid_optimization.high_acos', 0.60)
-        low_acos = self.config.get('bid_optimization.low_acos', 0.25)
-        up_pct = self.config.get('bid_optimization.up_pct', 0.15)
-        down_pct = self.config.get('bid_optimization.down_pct', 0.20)
-        min_bid = self.config.get('bid_optimization.min_bid', 0.25)
-        max_bid = self.config.get('bid_optimization.max_bid', 5.0)
-        
-        # Check if we have enough data
-        if metrics.clicks < min_clicks and metrics.cost < min_spend:
-            return None
-        
-        current_bid = keyword.bid
-        
-        # No sales - reduce bid
-        if metrics.sales <= 0 and metrics.clicks >= min_clicks:
-            new_bid = current_bid * (1 - down_pct)
-        # High ACOS - reduce bid
-        elif metrics.acos > high_acos:
-            new_bid = current_bid * (1 - down_pct)
-        # Low ACOS - increase bid
-        elif metrics.acos < low_acos and metrics.sales > 0:
-            new_bid = current_bid * (1 + up_pct)
-        # Medium ACOS - no change
-        else:
-            return None
-        
-        # Clamp to min/max
-        new_bid = max(min_bid, min(max_bid, new_bid))
-        
-        return round(new_bid, 2)
-    
-    def _get_bid_change_reason(self, keyword: Keyword, metrics: PerformanceMetrics, 
-                               new_bid: float) -> str:
+    def _get_bid_change_reason(self, rules: BidRules, clicks: float, sales: float,
+                               ctr: float, acos: float) -> str:
         """Get reason for bid change"""
-        if metrics.sales <= 0:
-            return f"No sales after {metrics.clicks} clicks"
-        elif metrics.acos > self.config.get('bid_optimization.high_acos', 0.60):
-            return f"High ACOS ({metrics.acos:.1%}) - reducing bid"
-        elif metrics.acos < self.config.get('bid_optimization.low_acos', 0.25):
-            return f"Low ACOS ({metrics.acos:.1%}) - increasing bid"
+        if sales <= 0:
+            return f"No sales after {int(clicks)} clicks"
+        elif acos > rules.high_acos:
+            return f"High ACOS ({acos:.1%}) - reducing bid"
+        elif acos < rules.low_acos:
+            return f"Low ACOS ({acos:.1%}) - increasing bid"
         else:
-            return f"ACOS: {metrics.acos:.1%}, CTR: {metrics.ctr:.2%}"
+            return f"ACOS: {acos:.1%}, CTR: {ctr:.2%}"
 
 
 class DaypartingManager:
@@ -975,11 +1326,12 @@ class DaypartingManager:
             logger.info("Dayparting is disabled in config")
             return {}
         
-        current_hour = datetime.now().hour
-        current_day = datetime.now().strftime('%A').upper()
+        now = datetime.now()
+        current_hour = now.hour
+        current_day = now.strftime('%A').upper()
         
         # Get multiplier for current hour
-        multiplier = self._get_multiplier(current_hour, current_day)
+        multiplier = self._get_multiplier(DaypartingRules.from_config(self.config), current_hour, current_day)
         
         logger.info(f"Current time: {current_day} {current_hour}:00, Multiplier: {multiplier:.2f}")
         
@@ -990,60 +1342,62 @@ class DaypartingManager:
             'multiplier': multiplier
         }
         
+        # Bid caps are constant for the whole pass
+        bid_rules = BidRules.from_config(self.config)
+        min_bid, max_bid = bid_rules.min_bid, bid_rules.max_bid
+        reason = f"Dayparting: {current_day} {current_hour}:00 ({multiplier:.2f}x)"
+        
         # Get all keywords
         keywords = self.api.get_keywords()
+        bid_updates = []
         
+        # Store base bids the first time a keyword is seen
         for keyword in keywords:
-            # Store base bid if not stored
-            if keyword.keyword_id not in self.base_bids:
-                self.base_bids[keyword.keyword_id] = keyword.bid
-            
-            base_bid = self.base_bids[keyword.keyword_id]
-            new_bid = base_bid * multiplier
+            self.base_bids.setdefault(keyword.keyword_id, keyword.bid)
+        
+        # Scale and cap every bid at once, then only walk the keywords that change
+        base_bids = np.fromiter((self.base_bids[kw.keyword_id] for kw in keywords),
+                                dtype=float, count=len(keywords))
+        current_bids = np.fromiter((kw.bid for kw in keywords), dtype=float, count=len(keywords))
+        new_bids = round_bids(np.clip(base_bids * multiplier, min_bid, max_bid))
+        changed = np.flatnonzero(np.abs(new_bids - current_bids) > 0.01)
+        
+        for index in changed:
+            keyword = keywords[index]
+            new_bid = float(new_bids[index])
             
-            # Apply bid caps
-            min_bid = self.config.get('bid_optimization.min_bid', 0.25)
-            max_bid = self.config.get('bid_optimization.max_bid', 5.0)
-            new_bid = max(min_bid, min(max_bid, new_bid))
-            new_bid = round(new_bid, 2)
+            self.audit.log(
+                'DAYPARTING_ADJUSTMENT',
+                'KEYWORD',
+                keyword.keyword_id,
+                f"${keyword.bid:.2f}",
+                f"${new_bid:.2f}",
+                reason,
+                dry_run
+            )
             
-            if abs(new_bid - keyword.bid) > 0.01:
-                self.audit.log(
-                    'DAYPARTING_ADJUSTMENT',
-                    'KEYWORD',
-                    keyword.keyword_id,
-                    f"${keyword.bid:.2f}",
-                    f"${new_bid:.2f}",
-                    f"Dayparting: {current_day} {current_hour}:00 ({multiplier:.2f}x)",
-                    dry_run
-                )
-                
-                if not dry_run:
-                    self.api.update_keyword_bid(keyword.keyword_id, new_bid)
-                
-                results['keywords_updated'] += 1
+            bid_updates.append({'keywordId': int(keyword.keyword_id), 'bid': new_bid})
+            results['keywords_updated'] += 1
+        
+        if bid_updates and not dry_run:
+            self.api.update_keyword_bids(bid_updates)
         
         logger.info(f"Dayparting applied: {results}")
         return results
     
-    def _get_multiplier(self, hour: int, day: str) -> float:
+    def _get_multiplier(self, rules: DaypartingRules, hour: int, day: str) -> float:
         """Get bid multiplier for specific hour and day"""
         # Get day-specific multipliers
-        day_multipliers = self.config.get('dayparting.day_multipliers', {})
-        day_multiplier = day_multipliers.get(day, 1.0)
+        day_multiplier = rules.day_multipliers.get(day, 1.0)
         
         # Get hour-specific multipliers
-        hour_multipliers = self.config.get('dayparting.hour_multipliers', {})
-        hour_multiplier = hour_multipliers.get(hour, 1.0)
+        hour_multiplier = rules.hour_multipliers.get(hour, 1.0)
         
         # Combined multiplier
         combined = day_multiplier * hour_multiplier
         
         # Clamp to reasonable range
-        min_mult = self.config.get('dayparting.min_multiplier', 0.4)
-        max_mult = self.config.get('dayparting.max_multiplier', 1.8)
-        
-        return max(min_mult, min(max_mult, combined))
+        return max(rules.min_multiplier, min(rules.max_multiplier, combined))
 
 
 class CampaignManager:
@@ -1064,84 +1418,67 @@ class CampaignManager:
             'no_change': 0
         }
         
-        # Get performance data
-        report_id = self.api.create_report(
-            'campaigns',
-            ['campaignId', 'impressions', 'clicks', 'cost', 
-             'attributedSales14d', 'attributedConversions14d']
+        # Get performance data and current campaigns concurrently
+        report_data, campaigns = run_concurrently(
+            lambda: self.api.fetch_report(*FEATURE_REPORTS['campaign_management']),
+            self.api.get_campaigns
         )
-        
-        if not report_id:
-            logger.error("Failed to create campaign report")
+        if report_data is None:
+            logger.error("Failed to get campaign report data")
             return results
         
-        report_url = self.api.wait_for_report(report_id)
-        if not report_url:
-            return results
+        campaign_map = {c.campaign_id: c for c in campaigns}
         
-        report_data = self.api.download_report(report_url)
+        rules = CampaignRules.from_config(self.config)
+        acos_threshold = rules.acos_threshold
+        campaign_updates = []
         
-        # Get current campaigns
-        campaigns = self.api.get_campaigns()
-        campaign_map = {c.campaign_id: c for c in campaigns}
+        frame = load_report_frame(report_data, id_columns=('campaignId',))
+        frame = frame[frame['campaignId'].isin(list(campaign_map))]
+        campaigns_analyzed = len(frame)
         
-        acos_threshold = self.config.get('campaign_management.acos_threshold', 0.45)
-        min_spend = self.config.get('campaign_management.min_spend', 20.0)
+        # Skip campaigns without enough spend, then score the rest in one columnar pass
+        frame = add_kpi_columns(frame[frame['cost'] >= rules.min_spend])
+        states = frame['campaignId'].map({cid: c.state for cid, c in campaign_map.items()}).to_numpy()
+        acos = frame['acos'].to_numpy(dtype=float)
+        activate_mask = (acos < acos_threshold) & (states != 'enabled')
+        pause_mask = (acos > acos_threshold) & (states == 'enabled')
         
-        for row in report_data:
-            campaign_id = row.get('campaignId')
-            if not campaign_id or campaign_id not in campaign_map:
-                continue
-            
-            campaign = campaign_map[campaign_id]
-            
-            # Calculate metrics
-            cost = float(row.get('cost', 0) or 0)
-            sales = float(row.get('attributedSales14d', 0) or 0)
-            
-            # Skip if not enough data
-            if cost < min_spend:
-                results['no_change'] += 1
-                continue
-            
-            acos = (cost / sales) if sales > 0 else float('inf')
+        results['no_change'] = campaigns_analyzed - int(activate_mask.sum()) - int(pause_mask.sum())
+        
+        for row, state in zip(frame[activate_mask].itertuples(index=False), states[activate_mask]):
+            # Activate campaign
+            self.audit.log(
+                'CAMPAIGN_ACTIVATE',
+                'CAMPAIGN',
+                row.campaignId,
+                state,
+                'enabled',
+                f"ACOS {row.acos:.1%} below threshold {acos_threshold:.1%}",
+                dry_run
+            )
             
-            # Determine action
-            if acos < acos_threshold and campaign.state != 'enabled':
-                # Activate campaign
-                self.audit.log(
-                    'CAMPAIGN_ACTIVATE',
-                    'CAMPAIGN',
-                    campaign_id,
-                    campaign.state,
-                    'enabled',
-                    f"ACOS {acos:.1%} below threshold {acos_threshold:.1%}",
-                    dry_run
-                )
-                
-                if not dry_run:
-                    self.api.update_campaign(campaign_id, {'state': 'enabled'})
-                
-                results['campaigns_activated'] += 1
+            campaign_updates.append({'campaignId': int(row.campaignId), 'state': 'enabled'})
+            results['campaigns_activated'] += 1
+        
+        for row, state in zip(frame[pause_mask].itertuples(index=False), states[pause_mask]):
+            # Pause campaign
+            self.audit.log(
+                'CAMPAIGN_PAUSE',
+                'CAMPAIGN',
+                row.campaignId,
+                state,
+                'paused',
+                f"ACOS {row.acos:.1%} above threshold {acos_threshold:.1%}",
+                dry_run
+            )
             
-            elif acos > acos_threshold and campaign.state == 'enabled':
-                # Pause campaign
-                self.audit.log(
-                    'CAMPAIGN_PAUSE',
-                    'CAMPAIGN',
-                    campaign_id,
-                    campaign.state,
-                    'paused',
-                    f"ACOS {acos:.1%} above threshold {acos_threshold:.1%}",
-                    dry_run
-                )
-                
-                if not dry_run:
-                    self.api.update_campaign(campaign_id, {'state': 'paused'})
-                
-                results['campaigns_paused'] += 1
-            else:
-                results['no_change'] += 1
+            campaign_updates.append({'campaignId': int(row.campaignId), 'state': 'paused'})
+            results['campaigns_paused'] += 1
+        
+        # Apply every state change in a single bulk request
+        if campaign_updates and not dry_run:
+            self.api.update_campaigns(campaign_updates)
         
         logger.info(f"Campaign management complete: {results}")
         return results
@@ -1164,74 +1501,57 @@ class KeywordDiscovery:
             'keywords_added': 0
         }
         
-        # Get search term report to find high-performing queries
-        report_id = self.api.create_report(
-            'targets',
-            ['campaignId', 'adGroupId', 'query', 'impressions', 'clicks', 
-             'cost', 'attributedSales14d', 'attributedConversions14d'],
-            segment='query'
+        # Get search term report and existing keywords concurrently
+        report_data, existing_keywords = run_concurrently(
+            lambda: self.api.fetch_report(*FEATURE_REPORTS['keyword_discovery']),
+            self.api.get_keywords
         )
-        
-        if not report_id:
-            logger.error("Failed to create search term report")
+        if report_data is None:
+            logger.error("Failed to get search term report data")
             return results
         
-        report_url = self.api.wait_for_report(report_id)
-        if not report_url:
-            return results
-        
-        report_data = self.api.download_report(report_url)
-        
-        # Get existing keywords to avoid duplicates
-        existing_keywords = self.api.get_keywords()
-        existing_keyword_texts = {
-            (kw.ad_group_id, kw.keyword_text.lower(), kw.match_type) 
-            for kw in existing_keywords
-        }
+        # Bucket existing exact keywords by ad group to avoid duplicates
+        existing_exact_texts: Dict[str, Set[str]] = defaultdict(set)
+        for kw in existing_keywords:
+            if kw.match_type == 'exact':
+                existing_exact_texts[kw.ad_group_id].add(kw.keyword_text.lower())
         
         # Analyze search terms
-        min_clicks = self.config.get('keyword_discovery.min_clicks', 5)
-        max_acos = self.config.get('keyword_discovery.max_acos', 0.40)
+        rules = KeywordDiscoveryRules.from_config(self.config)
+        min_clicks, max_acos = rules.min_clicks, rules.max_acos
         
         new_keywords_to_add = []
         
-        for row in report_data:
-            query = row.get('query', '').strip().lower()
-            ad_group_id = row.get('adGroupId')
-            campaign_id = row.get('campaignId')
-            
-            if not query or not ad_group_id:
-                continue
-            
-            # Calculate metrics
-            clicks = int(row.get('clicks', 0) or 0)
-            cost = float(row.get('cost', 0) or 0)
-            sales = float(row.get('attributedSales14d', 0) or 0)
-            
-            if clicks < min_clicks:
-                continue
-            
-            acos = (cost / sales) if sales > 0 else float('inf')
-            
-            if acos > max_acos:
-                continue
-            
-            # Check if already exists
-            if (ad_group_id, query, 'exact') in existing_keyword_texts:
+        # Filter search terms column-wise; only candidates reach the row loop
+        frame = load_report_frame(report_data, id_columns=('campaignId', 'adGroupId', 'query'))
+        frame['query'] = frame['query'].str.strip().str.lower()
+        frame = frame[(frame['query'] != '') & (frame['adGroupId'] != '') & (frame['clicks'] >= min_clicks)]
+        frame = add_kpi_columns(frame)
+        frame = frame[frame['acos'] <= max_acos]
+        
+        for row in frame.itertuples(index=False):
+            query = row.query
+            ad_group_id = row.adGroupId
+            campaign_id = row.campaignId
+            clicks = int(row.clicks)
+            acos = row.acos
+            
+            # Check if already exists (or was already queued by an earlier row)
+            ad_group_texts = existing_exact_texts[ad_group_id]
+            if query in ad_group_texts:
                 continue
+            ad_group_texts.add(query)
             
             results['keywords_discovered'] += 1
             
             # Prepare keyword for addition
-            suggested_bid = self.config.get('keyword_discovery.initial_bid', 0.75)
-            
             new_keywords_to_add.append({
                 'campaignId': int(campaign_id),
                 'adGroupId': int(ad_group_id),
                 'keywordText': query,
                 'matchType': 'exact',
                 'state': 'enabled',
-                'bid': suggested_bid
+                'bid': rules.initial_bid
             })
             
             self.audit.log(
@@ -1244,13 +1564,10 @@ class KeywordDiscovery:
                 dry_run
             )
         
-        # Add keywords in batches
+        # Add keywords in bulk batches, submitting batches concurrently
         if new_keywords_to_add and not dry_run:
-            batch_size = 100
-            for i in range(0, len(new_keywords_to_add), batch_size):
-                batch = new_keywords_to_add[i:i+batch_size]
-                created_ids = self.api.create_keywords(batch)
-                results['keywords_added'] += len(created_ids)
+            created = run_batches(self.api.create_keywords, new_keywords_to_add)
+            results['keywords_added'] += sum(len(ids) for ids in created)
         elif dry_run:
             results['keywords_added'] = len(new_keywords_to_add)
         
@@ -1274,53 +1591,37 @@ class NegativeKeywordManager:
             'negative_keywords_added': 0
         }
         
-        # Get search term report
-        report_id = self.api.create_report(
-            'targets',
-            ['campaignId', 'adGroupId', 'query', 'impressions', 'clicks', 
-             'cost', 'attributedSales14d', 'attributedConversions14d'],
-            segment='query'
+        # Get search term report and existing negative keywords concurrently
+        report_data, existing_negatives = run_concurrently(
+            lambda: self.api.fetch_report(*FEATURE_REPORTS['negative_keywords']),
+            self.api.get_negative_keywords
         )
-        
-        if not report_id:
+        if report_data is None:
             return results
         
-        report_url = self.api.wait_for_report(report_id)
-        if not report_url:
-            return results
-        
-        report_data = self.api.download_report(report_url)
-        
-        # Get existing negative keywords
-        existing_negatives = self.api.get_negative_keywords()
         existing_negative_texts = {
             (nk.get('campaignId'), nk.get('keywordText', '').lower())
             for nk in existing_negatives
         }
         
         # Analyze search terms
-        min_spend = self.config.get('negative_keywords.min_spend', 10.0)
-        max_acos = self.config.get('negative_keywords.max_acos', 1.0)
+        rules = NegativeKeywordRules.from_config(self.config)
+        min_spend, max_acos = rules.min_spend, rules.max_acos
         
         negatives_to_add = []
         
-        for row in report_data:
-            query = row.get('query', '').strip().lower()
-            campaign_id = row.get('campaignId')
-            
-            if not query or not campaign_id:
-                continue
-            
-            cost = float(row.get('cost', 0) or 0)
-            sales = float(row.get('attributedSales14d', 0) or 0)
-            
-            if cost < min_spend:
-                continue
-            
-            acos = (cost / sales) if sales > 0 else float('inf')
-            
-            if acos < max_acos:
-                continue
+        # Filter search terms column-wise; only candidates reach the row loop
+        frame = load_report_frame(report_data, id_columns=('campaignId', 'query'))
+        frame['query'] = frame['query'].str.strip().str.lower()
+        frame = frame[(frame['query'] != '') & (frame['campaignId'] != '') & (frame['cost'] >= min_spend)]
+        frame = add_kpi_columns(frame)
+        frame = frame[frame['acos'] >= max_acos]
+        
+        for row in frame.itertuples(index=False):
+            query = row.query
+            campaign_id = row.campaignId
+            cost = row.cost
+            acos = row.acos
             
             # Check if already negative
             if (campaign_id, query) in existing_negative_texts:
@@ -1343,13 +1644,10 @@ class NegativeKeywordManager:
                 dry_run
             )
         
-        # Add negative keywords
+        # Add negative keywords in batches of 100, submitting batches concurrently
         if negatives_to_add and not dry_run:
-            batch_size = 100
-            for i in range(0, len(negatives_to_add), batch_size):
-                batch = negatives_to_add[i:i+batch_size]
-                created_ids = self.api.create_negative_keywords(batch)
-                results['negative_keywords_added'] += len(created_ids)
+            created = run_batches(self.api.create_negative_keywords, negatives_to_add, batch_size=100)
+            results['negative_keywords_added'] += sum(len(ids) for ids in created)
         elif dry_run:
             results['negative_keywords_added'] = len(negatives_to_add)
         
@@ -1373,10 +1671,17 @@ class PPCAutomation:
         region = self.config.get('api.region', 'NA')
         self.api = AmazonAdsAPI(profile_id, region)
         
-        # Initialize audit logger
+        self._start_run()
+        
+        # Reused instances share the config and API client between runs
+        self._run_lock = threading.Lock()
+    
+    def _start_run(self):
+        """Build a fresh audit logger and feature modules for the next run"""
+        # Per-run state such as dayparting's base bids must not leak from one
+        # run of a reused instance into the next
         self.audit = AuditLogger()
         
-        # Initialize feature modules
         self.bid_optimizer = BidOptimizer(self.config, self.api, self.audit)
         self.dayparting = DaypartingManager(self.config, self.api, self.audit)
         self.campaign_manager = CampaignManager(self.config, self.api, self.audit)
@@ -1385,6 +1690,10 @@ class PPCAutomation:
     
     def run(self, features: List[str] = None):
         """Run automation with specified features"""
+        with self._run_lock:
+            return self._run(features)
+    
+    def _run(self, features: List[str] = None):
         logger.info("=" * 80)
         logger.info("AMAZON PPC AUTOMATION SUITE")
         logger.info("=" * 80)
@@ -1399,8 +1708,14 @@ class PPCAutomation:
         logger.info(f"Enabled features: {', '.join(features)}")
         
         results = {}
+        self._start_run()
         
         try:
+            # Request every report up front so Amazon generates them in parallel
+            self.api.prefetch_reports(
+                FEATURE_REPORTS[feature] for feature in features if feature in FEATURE_REPORTS
+            )
+            
             # Run each feature
             if 'bid_optimization' in features:
                 results['bid_optimization'] = self.bid_optimizer.optimize(self.dry_run)
@@ -1421,6 +1736,7 @@ class PPCAutomation:
             logger.error(f"Automation failed: {e}")
             logger.error(traceback.format_exc())
         finally:
+            self.api.clear_report_cache()
             # Save audit trail
             self.audit.save()
         
@@ -7,24 +7,50 @@ optional overrides for config path, features, and dry-run settings.
 
 from __future__ import annotations
 
+import atexit
+import functools
+import hashlib
 import json
 import logging
 import os
+import queue
+import threading
 import time
 from typing import Iterable, List, Optional
 
 import requests
 
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 
-from amazon_ppc_optimizer import PPCAutomation
+# _SESSION is the optimizer's pooled keep-alive session; sharing it lets warm
+# instances skip the TLS handshake to api.amazon.com in /check-oauth too
+from amazon_ppc_optimizer import TOKEN_URL, PPCAutomation, _SESSION
 
 try:  # Optional BigQuery logging
     from google.cloud import bigquery  # type: ignore
 except ImportError:  # pragma: no cover - optional dependency
     bigquery = None
 
+try:  # Optional fast JSON serialization
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Compact JSON responses serialized by orjson."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +60,12 @@ def _parse_features(raw: Optional[Iterable[str]]) -> Optional[List[str]]:
     if raw is None:
         return None
     if isinstance(raw, (list, tuple, set)):
-        return [str(item) for item in raw if str(item).strip()]
-    return [part.strip() for part in str(raw).split(",") if part.strip()]
+        return [text for item in raw if (text := str(item).strip())]
+    return [text for part in str(raw).split(",") if (text := part.strip())]
+
+
+_TRUTHY = frozenset({"1", "true", "t", "yes", "y"})
+_FALSY = frozenset({"0", "false", "f", "no", "n", ""})
 
 
 def _as_bool(value, default: bool = False) -> bool:
@@ -43,7 +73,12 @@ def _as_bool(value, default: bool = False) -> bool:
         return default
     if isinstance(value, bool):
         return value
-    return str(value).strip().lower() in {"1", "true", "t", "yes", "y"}
+    text = str(value).strip().lower()
+    if text in _TRUTHY:
+        return True
+    if text in _FALSY:
+        return False
+    return default
 
 
 DEFAULT_CONFIG_PATH = os.environ.get("PPC_CONFIG_PATH", "config.yaml")
@@ -51,14 +86,83 @@ DEFAULT_CONFIG_PATH = os.environ.get("PPC_CONFIG_PATH", "config.yaml")
 DEFAULT_PROFILE_ID = os.environ.get("AMAZON_PROFILE_ID")
 DEFAULT_DRY_RUN = _as_bool(os.environ.get("PPC_DRY_RUN"), False)
 BIGQUERY_TABLE = os.environ.get("BIGQUERY_TABLE")
+# Cloud Run binds secrets into the environment at startup and never changes them
+AMAZON_CLIENT_ID = os.environ.get("AMAZON_CLIENT_ID")
+AMAZON_CLIENT_SECRET = os.environ.get("AMAZON_CLIENT_SECRET")
+AMAZON_REFRESH_TOKEN = os.environ.get("AMAZON_REFRESH_TOKEN")
+BIGQUERY_BATCH_SIZE = 100
+BIGQUERY_FLUSH_INTERVAL = 5.0
+
+_BQ_CLIENT = None
+_BQ_QUEUE: "queue.Queue[dict]" = queue.Queue(maxsize=10_000)
+
+
+def _bigquery_enabled() -> bool:
+    return bool(BIGQUERY_TABLE) and bigquery is not None
+
+
+def _get_bigquery_client():
+    """Build the BigQuery client once, on first use."""
+    global _BQ_CLIENT
+    if _BQ_CLIENT is None:
+        _BQ_CLIENT = bigquery.Client()
+    return _BQ_CLIENT
+
+
+def _write_bigquery_rows(rows: List[dict]) -> None:
+    try:
+        errors = _get_bigquery_client().insert_rows_json(BIGQUERY_TABLE, rows)  # type: ignore[arg-type]
+    except Exception:  # pragma: no cover - logging only
+        logger.exception("BigQuery logging failed for %d row(s)", len(rows))
+        return
+    if errors:  # pragma: no cover - defensive logging only
+        logger.error("Failed to write optimizer runs to BigQuery: %s", errors)
+
+
+def _bigquery_flusher() -> None:
+    """Drain queued rows into BigQuery in batches of up to BIGQUERY_BATCH_SIZE."""
+    while True:
+        batch = [_BQ_QUEUE.get()]
+        deadline = time.monotonic() + BIGQUERY_FLUSH_INTERVAL
+        while len(batch) < BIGQUERY_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_BQ_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _write_bigquery_rows(batch)
+
+
+def _flush_bigquery_queue() -> None:
+    """Write whatever is still queued; runs at interpreter exit."""
+    rows = []
+    while True:
+        try:
+            rows.append(_BQ_QUEUE.get_nowait())
+        except queue.Empty:
+            break
+    if rows:
+        _write_bigquery_rows(rows)
+
+
+if _bigquery_enabled():
+    threading.Thread(target=_bigquery_flusher, name="bigquery-flusher", daemon=True).start()
+    atexit.register(_flush_bigquery_queue)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_automation(config_path: str, mtime: float, profile_id: str, dry_run: bool) -> PPCAutomation:
+    """Reuse a configured optimizer until its config file changes on disk."""
+    return PPCAutomation(config_path, profile_id, dry_run)
 
 
 def _insert_bigquery_row(profile_id: str, dry_run: bool, features: Optional[List[str]], results):
-    """Persist execution metadata to BigQuery when configured."""
-    if not BIGQUERY_TABLE or bigquery is None:
+    """Queue execution metadata for BigQuery when configured."""
+    if not _bigquery_enabled():
         return
 
-    client = bigquery.Client()
     row = {
         "profile_id": profile_id,
         "dry_run": dry_run,
@@ -67,27 +171,45 @@ def _insert_bigquery_row(profile_id: str, dry_run: bool, features: Optional[List
         "run_timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
     }
 
-    errors = client.insert_rows_json(BIGQUERY_TABLE, [row])  # type: ignore[arg-type]
-    if errors:  # pragma: no cover - defensive logging only
-        logger.error("Failed to write optimizer run to BigQuery: %s", errors)
+    try:
+        _BQ_QUEUE.put_nowait(row)
+    except queue.Full:  # pragma: no cover - defensive logging only
+        logger.warning("BigQuery queue full; dropping optimizer run for profile %s", profile_id)
+
+
+ROOT_MAX_AGE = 300
+# The root document never changes, so its body and ETag are built once
+_ROOT_BODY = f"{app.json.dumps({'status': 'ok', 'message': 'amazon-ppc-optimizer'})}\n".encode()
+_ROOT_ETAG = hashlib.sha1(_ROOT_BODY).hexdigest()
+
+
+def _probe_json(payload: dict):
+    """Probe responses must come from a live instance, never a cache."""
+    response = jsonify(payload)
+    response.cache_control.no_store = True
+    return response
 
 
 @app.get("/healthz")
 def healthcheck():
     """Simple readiness probe."""
-    return jsonify({"status": "ok"})
+    return _probe_json({"status": "ok"})
 
 
 @app.get("/")
 def root():
     """Root path for quick checks and Cloud Run default route."""
-    return jsonify({"status": "ok", "message": "amazon-ppc-optimizer"})
+    response = app.response_class(_ROOT_BODY, mimetype="application/json")
+    response.cache_control.public = True
+    response.cache_control.max_age = ROOT_MAX_AGE
+    response.set_etag(_ROOT_ETAG)
+    return response.make_conditional(request)
 
 
 @app.get("/health")
 def health_alias():
     """Alias to healthz for compatibility."""
-    return jsonify({"status": "ok"})
+    return _probe_json({"status": "ok"})
 
 
 @app.post("/run")
@@ -123,10 +245,11 @@ def run_optimizer():
             400,
         )
 
-    started_at = time.time()
+    started_at = time.perf_counter()
 
     try:
-        automation = PPCAutomation(config_path, str(profile_id), dry_run)
+        mtime = os.path.getmtime(config_path)
+        automation = _get_automation(config_path, mtime, str(profile_id), dry_run)
         results = automation.run(features)
     except SystemExit as exc:  # Underlying script uses sys.exit on fatal errors
         logger.exception("Optimizer exited early with status %s", exc.code)
@@ -148,7 +271,7 @@ def run_optimizer():
             500,
         )
 
-    runtime_seconds = time.time() - started_at
+    runtime_seconds = time.perf_counter() - started_at
 
     try:
         _insert_bigquery_row(str(profile_id), dry_run, features, results)
@@ -176,9 +299,9 @@ def check_oauth():
 
     Returns detailed diagnostics without running the optimizer.
     """
-    client_id = os.environ.get("AMAZON_CLIENT_ID")
-    client_secret = os.environ.get("AMAZON_CLIENT_SECRET")
-    refresh_token = os.environ.get("AMAZON_REFRESH_TOKEN")
+    client_id = AMAZON_CLIENT_ID
+    client_secret = AMAZON_CLIENT_SECRET
+    refresh_token = AMAZON_REFRESH_TOKEN
 
     missing = [k for k, v in {
         "AMAZON_CLIENT_ID": client_id,
@@ -195,8 +318,10 @@ def check_oauth():
         }), 400
 
     try:
-        resp = requests.post(
-            "https://api.amazon.com/auth/o2/token",
+        # Not retried: urllib3 leaves POSTs alone, and this probe should report
+        # the token endpoint's first answer as-is
+        resp = _SESSION.post(
+            TOKEN_URL,
             data={
                 "grant_type": "refresh_token",
                 "refresh_token": refresh_token,
@@ -228,4 +353,7 @@ def check_oauth():
 
 
 if __name__ == "__main__":
+    # Production serving goes through gunicorn (see Dockerfile); Werkzeug is dev-only
+    if not _as_bool(os.environ.get("FLASK_DEV")):
+        raise SystemExit("Serve with gunicorn, or set FLASK_DEV=1 to use the Flask development server.")
     app.run(host="0.0.0.0", port=int(os.environ.get("PORT", 8080)))
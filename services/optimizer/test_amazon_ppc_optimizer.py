@@ -0,0 +1,375 @@
+"""
+Unit tests for amazon_ppc_optimizer
+
+Run from this directory with:
+    python -m unittest test_amazon_ppc_optimizer
+"""
+
+import gzip
+import io
+import os
+import stat
+import tempfile
+import threading
+import time
+import unittest
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import amazon_ppc_optimizer as ppc
+
+
+def _report_csv(rows: int) -> bytes:
+    lines = [b"keywordId,query,clicks,cost"]
+    lines.extend(b"%d,NA,%d,%d.50" % (i, i % 7, i % 3) for i in range(rows))
+    return b"\n".join(lines) + b"\n"
+
+
+def _zipped(content: bytes) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w') as z:
+        z.writestr('report.csv', content)
+    return buf.getvalue()
+
+
+class _ReportHandler(BaseHTTPRequestHandler):
+    """Serves report bodies over keep-alive HTTP/1.1, like the report CDN"""
+    protocol_version = 'HTTP/1.1'
+    bodies = {}
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        body = self.bodies[self.path]
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ReadReportFrameTest(unittest.TestCase):
+    """read_report_frame must parse plain, gzip and zip report bodies"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _ReportHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        # read_report_frame only needs the shared session, not credentials
+        cls.api = object.__new__(ppc.AmazonAdsAPI)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def _check(self, rows: int):
+        content = _report_csv(rows)
+        _ReportHandler.bodies = {
+            '/plain': content,
+            '/gzip': gzip.compress(content),
+            '/zip': _zipped(content),
+        }
+
+        for path in _ReportHandler.bodies:
+            with self.subTest(path=path, rows=rows):
+                frame = self.api.read_report_frame(f"{self.base_url}{path}")
+                self.assertEqual(list(frame.columns), ['keywordId', 'query', 'clicks', 'cost'])
+                self.assertEqual(len(frame), rows)
+                self.assertEqual(frame['keywordId'].iloc[-1], str(rows - 1))
+                # Search terms like "NA" stay strings instead of becoming NaN
+                self.assertEqual(frame['query'].iloc[0], 'NA')
+
+    def test_small_report(self):
+        self._check(2)
+
+    def test_large_report(self):
+        self._check(50_000)
+
+    def test_download_report_parses_plain_csv(self):
+        _ReportHandler.bodies = {'/plain': _report_csv(3)}
+        self.assertEqual(len(self.api.download_report(f"{self.base_url}/plain")), 3)
+
+
+class TokenCacheTest(unittest.TestCase):
+    """Cached access tokens are only reused for the exact same credentials"""
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.cache_dir = cache_dir.name
+        patcher = mock.patch.object(ppc, 'TOKEN_CACHE_FILE', os.path.join(self.cache_dir, 'token.json'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _auth(self, token):
+        return ppc.Auth(access_token=token, token_type='Bearer', expires_at=time.time() + 3600)
+
+    def test_token_is_keyed_on_every_credential(self):
+        key = ppc._auth_cache_key('client', 'secret', 'refresh-1')
+        ppc._store_cached_auth(key, self._auth('token-1'))
+
+        self.assertEqual(ppc._load_cached_auth(key).access_token, 'token-1')
+        for other in (('client', 'secret', 'refresh-2'), ('client', 'secret-2', 'refresh-1')):
+            self.assertIsNone(ppc._load_cached_auth(ppc._auth_cache_key(*other)))
+
+    def test_cache_file_is_owner_only(self):
+        ppc._store_cached_auth('key', self._auth('token'))
+        self.assertEqual(stat.S_IMODE(os.stat(ppc.TOKEN_CACHE_FILE).st_mode), 0o600)
+
+    def test_concurrent_writers_leave_one_valid_entry(self):
+        keys = [f'key-{i}' for i in range(32)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda key: ppc._store_cached_auth(key, self._auth(key)), keys))
+
+        self.assertEqual(os.listdir(self.cache_dir), ['token.json'])
+        winners = [key for key in keys if ppc._load_cached_auth(key) is not None]
+        self.assertEqual(len(winners), 1)
+        self.assertEqual(ppc._load_cached_auth(winners[0]).access_token, winners[0])
+
+
+def _offline_api(auth):
+    """Build an AmazonAdsAPI without secrets or a token exchange"""
+    with mock.patch.object(ppc, 'get_runtime_secret', return_value='secret'), \
+            mock.patch.object(ppc.AmazonAdsAPI, '_authenticate', return_value=auth):
+        return ppc.AmazonAdsAPI('123')
+
+
+class ReportThreadingTest(unittest.TestCase):
+    """Report threads share one token refresh and stop when a run ends"""
+
+    def test_expired_token_is_refreshed_once(self):
+        api = _offline_api(ppc.Auth('old', 'Bearer', time.time() - 3600))
+        calls = []
+
+        def slow_authenticate():
+            calls.append(1)
+            time.sleep(0.05)
+            return ppc.Auth(f'new-{len(calls)}', 'Bearer', time.time() + 3600)
+
+        api._authenticate = slow_authenticate
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            headers = list(executor.map(lambda _: api._headers(), range(8)))
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual({h['Authorization'] for h in headers}, {'Bearer new-1'})
+
+    def test_clear_report_cache_stops_polling(self):
+        api = _offline_api(ppc.Auth('token', 'Bearer', time.time() + 3600))
+        api.create_report = mock.Mock(return_value='report-1')
+        api.get_report_status = mock.Mock(return_value={'status': 'IN_PROGRESS'})
+
+        spec = ('keywords', ('clicks',), None)
+        api.prefetch_reports([spec])
+        future = api._report_futures[spec]
+        time.sleep(0.1)
+
+        started = time.monotonic()
+        api.clear_report_cache()
+        self.assertLess(time.monotonic() - started, 2.0)
+        self.assertTrue(future.done())
+        self.assertIsNone(future.result())
+        self.assertEqual(api._report_futures, {})
+
+
+
+class _RateLimitedHandler(BaseHTTPRequestHandler):
+    """Answers every request with 429 and counts how many arrive"""
+    protocol_version = 'HTTP/1.1'
+    hits = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        type(self).hits += 1
+        self.send_response(429)
+        self.send_header('Retry-After', '0')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+class RequestRetryTest(unittest.TestCase):
+    """Status retries happen once, in _request, not again in the session"""
+
+    def test_session_only_retries_connection_failures(self):
+        retry = ppc._SESSION.get_adapter('https://advertising-api.amazon.com').max_retries
+        self.assertGreater(retry.connect, 0)
+        for status in (429, 500, 502, 503, 504):
+            self.assertFalse(retry.is_retry('GET', status, has_retry_after=True))
+
+    def test_rate_limited_request_is_sent_once_per_attempt(self):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _RateLimitedHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        # Route the local server through the same adapter as the Ads API
+        ppc._SESSION.mount(base_url, ppc._SESSION.get_adapter('https://advertising-api.amazon.com'))
+        self.addCleanup(ppc._SESSION.adapters.pop, base_url)
+
+        api = _offline_api(ppc.Auth('token', 'Bearer', time.time() + 3600))
+        api.base_url = base_url
+        with self.assertRaises(Exception):
+            api._request('GET', '/v2/campaigns')
+        self.assertEqual(_RateLimitedHandler.hits, 3)
+
+class BidRoundingTest(unittest.TestCase):
+    """New bids are rounded like round(bid, 2), not np.round"""
+
+    def test_round_bids_matches_python_round(self):
+        bids = np.array([1.3 * 1.15, 3.7 * 1.15, 0.25 * 1.3, np.nan])
+        rounded = ppc.round_bids(bids)
+        np.testing.assert_array_equal(rounded[:3], [1.49, 4.25, 0.33])
+        self.assertTrue(np.isnan(rounded[3]))
+
+    def test_decide_bid_changes_pins_half_cent_cases(self):
+        # Low ACOS rows get +15%; the last row has no sales and gets -20%.
+        # np.round would give 1.50 and 4.26 for the first two.
+        frame = pd.DataFrame({
+            'clicks': [30.0, 30.0, 30.0, 30.0],
+            'cost': [2.0, 2.0, 2.0, 2.0],
+            'attributedSales14d': [20.0, 20.0, 5.0, 0.0],
+            'acos': [0.1, 0.1, 0.4, np.inf],
+        })
+        current_bids = np.array([1.30, 3.70, 1.00, 0.70])
+        new_bids = ppc.decide_bid_changes(ppc.BidRules(), frame, current_bids)
+
+        np.testing.assert_array_equal(new_bids[[0, 1, 3]], [1.49, 4.25, 0.56])
+        # Medium ACOS: no change
+        self.assertTrue(np.isnan(new_bids[2]))
+
+    def test_decide_bid_changes_matches_per_keyword_rounding(self):
+        rules = ppc.BidRules()
+        bids = np.round(np.random.default_rng(0).uniform(0.2, 6.0, 20_000), 2)
+        frame = pd.DataFrame({
+            'clicks': np.full(len(bids), 30.0),
+            'cost': np.full(len(bids), 2.0),
+            'attributedSales14d': np.full(len(bids), 20.0),
+            'acos': np.full(len(bids), 0.1),
+        })
+        expected = [
+            round(max(rules.min_bid, min(rules.max_bid, bid * (1 + rules.up_pct))), 2)
+            for bid in bids.tolist()
+        ]
+        np.testing.assert_array_equal(ppc.decide_bid_changes(rules, frame, bids), expected)
+
+
+class _StaticConfig:
+    """Config stand-in backed by a flat dict of dotted keys"""
+
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+class _KeywordAPI:
+    """API stand-in that lists fixed keywords and records bid updates"""
+
+    def __init__(self, bids):
+        self.keywords = [
+            ppc.Keyword(str(i), '1', '1', f'kw {i}', 'exact', 'enabled', bid)
+            for i, bid in enumerate(bids)
+        ]
+        self.updates = []
+
+    def get_keywords(self):
+        return self.keywords
+
+    def update_keyword_bids(self, updates):
+        self.updates.extend(updates)
+        return len(updates)
+
+
+class DaypartingRoundingTest(unittest.TestCase):
+    """Dayparted bids are rounded like round(base_bid * multiplier, 2)"""
+
+    def setUp(self):
+        self.audit_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.audit_dir.cleanup)
+
+    def _apply(self, bids, multiplier):
+        days = ('MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY')
+        config = _StaticConfig({
+            'dayparting.enabled': True,
+            'dayparting.day_multipliers': {day: multiplier for day in days},
+        })
+        api = _KeywordAPI(bids)
+        audit = ppc.AuditLogger(self.audit_dir.name)
+        ppc.DaypartingManager(config, api, audit).apply_dayparting()
+        audit.save()
+        return {int(update['keywordId']): update['bid'] for update in api.updates}
+
+    def test_pins_half_cent_cases(self):
+        # np.round would give 1.50, 1.88 and 2.14
+        updates = self._apply([1.15, 1.45, 1.65], 1.3)
+        self.assertEqual(updates, {0: 1.49, 1: 1.89, 2: 2.15})
+
+    def test_matches_per_keyword_rounding(self):
+        bids = np.round(np.random.default_rng(1).uniform(0.2, 6.0, 20_000), 2).tolist()
+        expected = {}
+        for i, bid in enumerate(bids):
+            new_bid = round(max(0.25, min(5.0, bid * 1.3)), 2)
+            if abs(new_bid - bid) > 0.01:
+                expected[i] = new_bid
+        self.assertEqual(self._apply(bids, 1.3), expected)
+
+
+
+class _RunAPI(_KeywordAPI):
+    """Keyword API stand-in that also accepts the run's report calls"""
+
+    def __init__(self, profile_id, region):
+        super().__init__([1.00])
+
+    def prefetch_reports(self, specs):
+        pass
+
+    def clear_report_cache(self):
+        pass
+
+
+class ReusedAutomationTest(unittest.TestCase):
+    """A cached PPCAutomation starts every run from fresh per-run state"""
+
+    def setUp(self):
+        work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(work_dir.cleanup)
+        # AuditLogger writes into the working directory
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(work_dir.name)
+
+        days = ('MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY')
+        with open('config.yaml', 'w') as f:
+            f.write("dayparting:\n  enabled: true\n  day_multipliers:\n")
+            f.writelines(f"    {day}: 1.3\n" for day in days)
+
+        with mock.patch.object(ppc, 'AmazonAdsAPI', _RunAPI):
+            self.automation = ppc.PPCAutomation('config.yaml', '123')
+
+    def test_dayparting_scales_the_current_bid_each_run(self):
+        api = self.automation.api
+        self.automation.run(['dayparting'])
+        self.assertEqual(api.updates, [{'keywordId': 0, 'bid': 1.3}])
+
+        # Bid optimization or a manual edit moved the bid between runs
+        api.keywords[0].bid = 2.00
+        self.automation.run(['dayparting'])
+        self.assertEqual(api.updates[-1], {'keywordId': 0, 'bid': 2.6})
+
+    def test_each_run_writes_its_own_audit_file(self):
+        for _ in range(3):
+            self.automation.run(['dayparting'])
+        self.assertEqual(len([name for name in os.listdir('.') if name.startswith('ppc_audit_')]), 3)
+
+if __name__ == '__main__':
+    unittest.main()
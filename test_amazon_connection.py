@@ -9,23 +9,59 @@ This script tests the connection to the Amazon Advertising API to verify:
 3. Can retrieve profile information
 4. Can make basic API calls
 
+Requires requests. Optional extras:
+    aiohttp         --async concurrent profile checks
+    httpx[http2]    HTTP/2 for the token and profile calls
+    orjson          faster JSON parsing
+
 Usage:
     python test_amazon_connection.py --config config.json
     python test_amazon_connection.py --config config.json --profile-id YOUR_PROFILE_ID
+    python test_amazon_connection.py --config config.json --profile-id YOUR_PROFILE_ID --async
+    python test_amazon_connection.py --config config.json --token-cache
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
+import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Tuple
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("ERROR: requests library is required. Install with: pip install requests")
     sys.exit(1)
 
+try:  # Optional: HTTP/2 (one multiplexed connection per host) for the API calls
+    import httpx
+    import h2  # noqa: F401 - required by httpx for http2=True
+except ImportError:
+    httpx = None
+
+try:  # Optional: concurrent profile checks with --async
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:  # Optional: faster JSON parsing
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+try:  # Not available on Windows; the token cache then skips file locking
+    import fcntl
+except ImportError:
+    fcntl = None
+
 # Amazon Advertising API endpoints
 ENDPOINTS = {
     "NA": "https://advertising-api.amazon.com",
@@ -36,46 +72,105 @@ ENDPOINTS = {
 TOKEN_URL = "https://api.amazon.com/auth/o2/token"
 USER_AGENT = "PPC-Connection-Test/1.0"
 
-# Color codes for terminal output
-GREEN = '\033[92m'
-RED = '\033[91m'
-YELLOW = '\033[93m'
-BLUE = '\033[94m'
-RESET = '\033[0m'
+# Access tokens are reused across runs until shortly before they expire
+TOKEN_CACHE_FILE = os.path.expanduser("~/.cache/ppc-upload/amazon_token.json")
+TOKEN_EXPIRY_BUFFER_SECONDS = 60
+
+# Secret Manager values are reused for this long within one process
+SECRET_CACHE_TTL_SECONDS = 300
+_SECRET_CLIENT = None
+_SECRET_CLIENT_LOCK = threading.Lock()
+_SECRET_CACHE: Dict[Tuple[str, str], Tuple[float, Optional[str]]] = {}
+
+
+def _build_session():
+    """Create a keep-alive client shared by the token and profile calls
+
+    Uses an HTTP/2 httpx client when available, otherwise a requests session.
+    """
+    if httpx is not None:
+        # With an explicit transport httpx ignores the client's http2/limits,
+        # so both are configured on the transport itself
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+        )
+        return httpx.Client(
+            timeout=10.0,
+            transport=transport,
+            headers={'User-Agent': USER_AGENT},
+        )
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.headers.update({'User-Agent': USER_AGENT})
+    return session
+
+
+_SESSION = _build_session()
+
+# Exceptions raised by whichever client _SESSION is
+if httpx is not None:
+    HTTP_TIMEOUT_ERRORS = (requests.exceptions.Timeout, httpx.TimeoutException)
+    HTTP_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+else:
+    HTTP_TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+    HTTP_ERRORS = (requests.exceptions.RequestException,)
+
+# Color codes for terminal output, left out when stdout is redirected
+_COLOR = sys.stdout.isatty()
+GREEN = '\033[92m' if _COLOR else ''
+RED = '\033[91m' if _COLOR else ''
+YELLOW = '\033[93m' if _COLOR else ''
+BLUE = '\033[94m' if _COLOR else ''
+RESET = '\033[0m' if _COLOR else ''
+
+# Message framing, built once instead of on every call
+_SUCCESS = f"{GREEN}✅ "
+_ERROR = f"{RED}❌ "
+_WARNING = f"{YELLOW}⚠️  "
+_INFO = f"{BLUE}ℹ️  "
+_END = f"{RESET}\n"
+_HEADER = f"\n{BLUE}{'=' * 70}\n"
+_HEADER_END = f"\n{'=' * 70}{RESET}\n\n"
 
 
 def print_success(text: str):
     """Print success message"""
-    print(f"{GREEN}✅ {text}{RESET}")
+    sys.stdout.write(_SUCCESS + text + _END)
 
 
 def print_error(text: str):
     """Print error message"""
-    print(f"{RED}❌ {text}{RESET}")
+    sys.stdout.write(_ERROR + text + _END)
 
 
 def print_warning(text: str):
     """Print warning message"""
-    print(f"{YELLOW}⚠️  {text}{RESET}")
+    sys.stdout.write(_WARNING + text + _END)
 
 
 def print_info(text: str):
     """Print info message"""
-    print(f"{BLUE}ℹ️  {text}{RESET}")
+    sys.stdout.write(_INFO + text + _END)
 
 
 def print_header(text: str):
     """Print formatted header"""
-    print(f"\n{BLUE}{'=' * 70}")
-    print(f"{text}")
-    print(f"{'=' * 70}{RESET}\n")
+    sys.stdout.write(_HEADER + text + _HEADER_END)
 
 
 def load_config(config_path: str) -> Dict:
     """Load configuration from JSON file"""
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        with open(config_path, 'rb') as f:
+            config = json_loads(f.read())
         return config
     except FileNotFoundError:
         print_warning(f"Configuration file not found: {config_path}")
@@ -85,10 +180,65 @@ def load_config(config_path: str) -> Dict:
         sys.exit(1)
 
 
-def get_access_token(client_id: str, client_secret: str, refresh_token: str) -> Tuple[Optional[str], Optional[str]]:
+def _token_cache_key(client_id: str, client_secret: str, refresh_token: str) -> str:
+    """Key cache entries by a hash of every credential, so rotating any of them misses"""
+    material = '\0'.join((client_id, client_secret, refresh_token))
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+def _lock_file(f, exclusive: bool):
+    """Hold an advisory lock on f until it is closed"""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+
+def _load_cached_token(cache_key: str) -> Optional[Tuple[str, int]]:
+    """Return (access_token, seconds_left) if a cached token is still fresh"""
+    try:
+        with open(TOKEN_CACHE_FILE, 'r', encoding='utf-8') as f:
+            _lock_file(f, exclusive=False)
+            cache = json.load(f)
+        entry = cache[cache_key]
+        seconds_left = int(float(entry['exp']) - time.time())
+        if seconds_left > TOKEN_EXPIRY_BUFFER_SECONDS:
+            return entry['access_token'], seconds_left
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _store_cached_token(cache_key: str, access_token: str, expires_in: int):
+    """Persist an access token with owner-only permissions"""
+    try:
+        os.makedirs(os.path.dirname(TOKEN_CACHE_FILE), mode=0o700, exist_ok=True)
+        fd = os.open(TOKEN_CACHE_FILE, os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, 'r+', encoding='utf-8') as f:
+            _lock_file(f, exclusive=True)
+            try:
+                cache = json.load(f)
+            except ValueError:
+                cache = {}
+            if not isinstance(cache, dict):
+                cache = {}
+            
+            cache[cache_key] = {
+                'access_token': access_token,
+                'exp': time.time() + int(expires_in),
+            }
+            f.seek(0)
+            f.truncate()
+            json.dump(cache, f)
+    except OSError as e:
+        print_warning(f"Could not cache access token: {e}")
+
+
+def get_access_token(client_id: str, client_secret: str, refresh_token: str,
+                     store: bool = False) -> Tuple[Optional[str], Optional[str]]:
     """
     Obtain access token from Amazon using refresh token
     
+    Always performs the exchange; store=True also saves the token for --token-cache.
+    
     Returns:
         Tuple of (access_token, error_message)
     """
@@ -102,7 +252,7 @@ def get_access_token(client_id: str, client_secret: str, refresh_token: str) ->
             'client_secret': client_secret
         }
         
-        response = requests.post(TOKEN_URL, data=data, timeout=10)
+        response = _SESSION.post(TOKEN_URL, data=data, timeout=10)
         
         if response.status_code == 200:
             token_data = response.json()
@@ -110,125 +260,211 @@ def get_access_token(client_id: str, client_secret: str, refresh_token: str) ->
             expires_in = token_data.get('expires_in', 3600)
             
             print_success(f"Access token obtained (expires in {expires_in} seconds)")
+            if access_token and store:
+                cache_key = _token_cache_key(client_id, client_secret, refresh_token)
+                _store_cached_token(cache_key, access_token, expires_in)
             return access_token, None
         else:
             error_msg = f"HTTP {response.status_code}: {response.text}"
             return None, error_msg
             
-    except requests.exceptions.Timeout:
+    except HTTP_TIMEOUT_ERRORS:
         return None, "Request timed out after 10 seconds"
-    except requests.exceptions.RequestException as e:
+    except HTTP_ERRORS as e:
         return None, f"Network error: {str(e)}"
     except Exception as e:
         return None, f"Unexpected error: {str(e)}"
 
 
-def test_profiles_api(access_token: str, region: str) -> Tuple[bool, Optional[str], Optional[list]]:
+def _api_headers(access_token: str, client_id: str) -> Dict[str, str]:
+    """Headers shared by every Advertising API call; User-Agent is set on the session"""
+    return {
+        'Authorization': f'Bearer {access_token}',
+        'Amazon-Advertising-API-ClientId': client_id,
+    }
+
+
+def _profiles_url(region: str, profile_id: Optional[str] = None) -> str:
+    """URL of the profiles list, or of one profile"""
+    url = f"{ENDPOINTS.get(region, ENDPOINTS['NA'])}/v2/profiles"
+    return url if profile_id is None else f"{url}/{profile_id}"
+
+
+def _profiles_request(auth_headers: Dict[str, str], region: str,
+                      profile_id: Optional[str] = None) -> Tuple[str, Dict[str, str]]:
+    """Return the (url, headers) of a profiles check"""
+    if profile_id is None:
+        return _profiles_url(region), auth_headers
+    return _profiles_url(region, profile_id), {**auth_headers, 'Amazon-Advertising-API-Scope': profile_id}
+
+
+def _announce_profiles_check(region: str, profile_id: Optional[str] = None):
+    """Print which profiles check is running"""
+    if profile_id is None:
+        print_info(f"Testing profiles API at: {_profiles_url(region)}")
+    else:
+        print_info(f"Testing access to profile: {profile_id}")
+
+
+def _profiles_result(result: Tuple[bool, Optional[str], Optional[object]],
+                     profile_id: Optional[str] = None) -> Tuple[bool, Optional[str], Optional[object]]:
+    """Report a finished profiles check and pass its result through"""
+    success, _, data = result
+    if success and profile_id is None:
+        print_success(f"Profiles API responded successfully ({len(data)} profiles found)")
+    elif success:
+        print_success("Profile access successful")
+    return result
+
+
+def _api_result(status: int, body: bytes) -> Tuple[bool, Optional[str], Optional[object]]:
+    """Turn a response status and body into (success, error_message, data)"""
+    if status == 200:
+        return True, None, json_loads(body)
+    return False, f"HTTP {status}: {body.decode('utf-8', errors='replace')}", None
+
+
+def _request_error(e: Exception) -> str:
+    """Describe a failed request the same way for every HTTP client"""
+    if isinstance(e, HTTP_TIMEOUT_ERRORS + (asyncio.TimeoutError,)):
+        return "Request timed out after 10 seconds"
+    if isinstance(e, HTTP_ERRORS) or (aiohttp is not None and isinstance(e, aiohttp.ClientError)):
+        return f"Network error: {str(e)}"
+    return f"Unexpected error: {str(e)}"
+
+
+def _get_json(url: str, headers: Dict[str, str]) -> Tuple[bool, Optional[str], Optional[object]]:
+    """GET a JSON document, returning (success, error_message, data)"""
+    try:
+        response = _SESSION.get(url, headers=headers, timeout=10)
+        return _api_result(response.status_code, response.content)
+    except Exception as e:
+        return False, _request_error(e), None
+
+
+async def _get_json_async(session, url: str, headers: Dict[str, str]) -> Tuple[bool, Optional[str], Optional[object]]:
+    """Async variant of _get_json on an aiohttp session"""
+    try:
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            return _api_result(response.status, await response.read())
+    except Exception as e:
+        return False, _request_error(e), None
+
+
+def test_profiles_api(auth_headers: Dict[str, str], region: str) -> Tuple[bool, Optional[str], Optional[list]]:
     """
     Test the profiles API endpoint
     
     Returns:
         Tuple of (success, error_message, profiles_list)
     """
-    try:
-        endpoint = ENDPOINTS.get(region, ENDPOINTS["NA"])
-        url = f"{endpoint}/v2/profiles"
-        
-        print_info(f"Testing profiles API at: {url}")
-        
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Amazon-Advertising-API-ClientId': 'test-client',
-            'User-Agent': USER_AGENT,
-            'Content-Type': 'application/json'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        
-        if response.status_code == 200:
-            profiles = response.json()
-            print_success(f"Profiles API responded successfully ({len(profiles)} profiles found)")
-            return True, None, profiles
-        else:
-            error_msg = f"HTTP {response.status_code}: {response.text}"
-            return False, error_msg, None
-            
-    except requests.exceptions.Timeout:
-        return False, "Request timed out after 10 seconds", None
-    except requests.exceptions.RequestException as e:
-        return False, f"Network error: {str(e)}", None
-    except Exception as e:
-        return False, f"Unexpected error: {str(e)}", None
+    _announce_profiles_check(region)
+    return _profiles_result(_get_json(*_profiles_request(auth_headers, region)))
 
 
-def test_specific_profile(access_token: str, region: str, profile_id: str) -> Tuple[bool, Optional[str], Optional[Dict]]:
+def test_specific_profile(auth_headers: Dict[str, str], region: str, profile_id: str) -> Tuple[bool, Optional[str], Optional[Dict]]:
     """
     Test access to a specific profile
     
     Returns:
         Tuple of (success, error_message, profile_data)
     """
-    try:
-        endpoint = ENDPOINTS.get(region, ENDPOINTS["NA"])
-        url = f"{endpoint}/v2/profiles/{profile_id}"
-        
-        print_info(f"Testing access to profile: {profile_id}")
-        
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Amazon-Advertising-API-ClientId': 'test-client',
-            'Amazon-Advertising-API-Scope': profile_id,
-            'User-Agent': USER_AGENT,
-            'Content-Type': 'application/json'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        
-        if response.status_code == 200:
-            profile = response.json()
-            print_success(f"Profile access successful")
-            return True, None, profile
-        else:
-            error_msg = f"HTTP {response.status_code}: {response.text}"
-            return False, error_msg, None
-            
-    except requests.exceptions.Timeout:
-        return False, "Request timed out after 10 seconds", None
-    except requests.exceptions.RequestException as e:
-        return False, f"Network error: {str(e)}", None
-    except Exception as e:
-        return False, f"Unexpected error: {str(e)}", None
+    _announce_profiles_check(region, profile_id)
+    return _profiles_result(_get_json(*_profiles_request(auth_headers, region, profile_id)), profile_id)
+
+
+async def test_profiles_api_async(session, auth_headers: Dict[str, str], region: str) -> Tuple[bool, Optional[str], Optional[list]]:
+    """Async variant of test_profiles_api; the caller reports the result"""
+    return await _get_json_async(session, *_profiles_request(auth_headers, region))
+
+
+async def test_specific_profile_async(session, auth_headers: Dict[str, str], region: str,
+                                      profile_id: str) -> Tuple[bool, Optional[str], Optional[Dict]]:
+    """Async variant of test_specific_profile; the caller reports the result"""
+    return await _get_json_async(session, *_profiles_request(auth_headers, region, profile_id))
+
+
+async def _check_profiles_async(auth_headers: Dict[str, str], region: str, profile_id: Optional[str]):
+    """Run the profiles list and specific profile checks concurrently
+
+    Nothing is printed here; main() reports both results in step order.
+    """
+    connector = aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(headers={'User-Agent': USER_AGENT}, connector=connector) as session:
+        checks = [test_profiles_api_async(session, auth_headers, region)]
+        if profile_id:
+            checks.append(test_specific_profile_async(session, auth_headers, region, profile_id))
+        results = await asyncio.gather(*checks)
+    
+    return results[0], (results[1] if profile_id else None)
+
+
+def _get_secret_manager_client():
+    """Create the Secret Manager client once and reuse it"""
+    global _SECRET_CLIENT
+    with _SECRET_CLIENT_LOCK:
+        if _SECRET_CLIENT is None:
+            # Lazy import to avoid hard dependency when not needed
+            from google.cloud import secretmanager  # type: ignore
+            _SECRET_CLIENT = secretmanager.SecretManagerServiceClient()
+    return _SECRET_CLIENT
 
 
 def _get_secret_manager_value(secret_name: str, project_id: Optional[str] = None) -> Optional[str]:
     """Fetch a secret value from Google Secret Manager if available."""
+    pid = project_id or os.environ.get('GOOGLE_CLOUD_PROJECT') or os.environ.get('GCLOUD_PROJECT')
+    if not pid:
+        return None
+    
+    key = (pid, secret_name)
+    cached = _SECRET_CACHE.get(key)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+    
     try:
-        # Lazy import to avoid hard dependency when not needed
-        from google.cloud import secretmanager  # type: ignore
-        import os
-        pid = project_id or os.environ.get('GOOGLE_CLOUD_PROJECT') or os.environ.get('GCLOUD_PROJECT')
-        if not pid:
-            return None
-        client = secretmanager.SecretManagerServiceClient()
+        client = _get_secret_manager_client()
         name = f"projects/{pid}/secrets/{secret_name}/versions/latest"
         response = client.access_secret_version(request={"name": name})
-        payload = response.payload.data.decode('utf-8')
-        return payload.strip()
+        value = response.payload.data.decode('utf-8').strip()
     except Exception:
-        return None
+        value = None
+    
+    # Misses are cached too, so an absent secret costs one RPC per TTL
+    _SECRET_CACHE[key] = (time.monotonic() + SECRET_CACHE_TTL_SECONDS, value)
+    return value
+
+
+# Config field -> ENV / Secret Manager name
+CREDENTIAL_NAMES = {
+    'client_id': 'AMAZON_CLIENT_ID',
+    'client_secret': 'AMAZON_CLIENT_SECRET',
+    'refresh_token': 'AMAZON_REFRESH_TOKEN',
+    'profile_id': 'AMAZON_PROFILE_ID',
+}
 
 
-def _get_credential(name: str, default: str = "") -> str:
-    """Resolve a credential from ENV first, then Secret Manager, else default."""
-    import os
-    val = os.environ.get(name)
-    if val:
-        return val.strip()
-    # Try Secret Manager
-    sm_val = _get_secret_manager_value(name)
-    if sm_val:
-        return sm_val.strip()
-    return default
+def _resolve_credentials(api_config: Dict) -> Dict[str, str]:
+    """Resolve credentials from config, then ENV, then Secret Manager.
+
+    Whatever is still missing after config and ENV is fetched from Secret
+    Manager concurrently, sharing one (thread-safe) client.
+    """
+    credentials = {}
+    missing = []
+    for field, name in CREDENTIAL_NAMES.items():
+        value = api_config.get(field, '') or os.environ.get(name, '').strip()
+        if value:
+            credentials[field] = value
+        else:
+            missing.append(field)
+    
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            values = executor.map(_get_secret_manager_value, [CREDENTIAL_NAMES[f] for f in missing])
+            for field, value in zip(missing, values):
+                credentials[field] = value or ''
+    
+    return credentials
 
 
 def main():
@@ -244,9 +480,25 @@ def main():
         '--profile-id',
         help='Optional: Test access to a specific profile ID'
     )
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help='Run the profile checks concurrently (requires aiohttp)'
+    )
+    parser.add_argument(
+        '--token-cache',
+        action='store_true',
+        help='Reuse a cached access token for these exact credentials instead of '
+             'exchanging the refresh token (skips verifying them)'
+    )
     
     args = parser.parse_args()
     
+    if args.use_async and aiohttp is None:
+        print_warning("aiohttp is not installed; running profile checks sequentially")
+        args.use_async = False
+    
     print_header("Amazon Advertising API Connection Test")
     
     # Step 1: Load configuration
@@ -256,11 +508,12 @@ def main():
     # Check if credentials are placeholders
     api_config = config.get('amazon_api', {})
     # Resolve credentials from ENV/Secret Manager if config missing or placeholders
-    client_id = api_config.get('client_id', '') or _get_credential('AMAZON_CLIENT_ID')
-    client_secret = api_config.get('client_secret', '') or _get_credential('AMAZON_CLIENT_SECRET')
-    refresh_token = api_config.get('refresh_token', '') or _get_credential('AMAZON_REFRESH_TOKEN')
+    credentials = _resolve_credentials(api_config)
+    client_id = credentials['client_id']
+    client_secret = credentials['client_secret']
+    refresh_token = credentials['refresh_token']
     region = api_config.get('region', 'NA')
-    config_profile_id = api_config.get('profile_id', '') or _get_credential('AMAZON_PROFILE_ID')
+    config_profile_id = credentials['profile_id']
     
     if (not client_id or not client_secret or not refresh_token) or \
        ('YOUR_' in client_id or 'YOUR_' in client_secret or 'YOUR_' in refresh_token):
@@ -275,7 +528,18 @@ def main():
     
     # Step 2: Get access token
     print_header("Step 1: Testing OAuth Authentication")
-    access_token, error = get_access_token(client_id, client_secret, refresh_token)
+    cached = None
+    if args.token_cache:
+        cached = _load_cached_token(_token_cache_key(client_id, client_secret, refresh_token))
+    if cached:
+        access_token, seconds_left = cached
+        error = None
+        print_warning(f"Using cached access token (expires in {seconds_left} seconds); "
+                      "credentials were not re-verified")
+        print_info("Run without --token-cache to test the token exchange")
+    else:
+        access_token, error = get_access_token(client_id, client_secret, refresh_token,
+                                               store=args.token_cache)
     
     if not access_token:
         print_error(f"Failed to obtain access token: {error}")
@@ -285,9 +549,22 @@ def main():
         print_warning("  - Network connectivity issues")
         sys.exit(1)
     
+    auth_headers = _api_headers(access_token, client_id)
+    profile_to_test = args.profile_id or config_profile_id
+    if profile_to_test == 'YOUR_PROFILE_ID_HERE':
+        profile_to_test = None
+    
     # Step 3: Test profiles API
     print_header("Step 2: Testing Profiles API")
-    success, error, profiles = test_profiles_api(access_token, region)
+    profile_check = None
+    if args.use_async:
+        profiles_check, profile_check = asyncio.run(
+            _check_profiles_async(auth_headers, region, profile_to_test)
+        )
+        _announce_profiles_check(region)
+        success, error, profiles = _profiles_result(profiles_check)
+    else:
+        success, error, profiles = test_profiles_api(auth_headers, region)
     
     if not success:
         print_error(f"Profiles API test failed: {error}")
@@ -313,11 +590,13 @@ def main():
             print()
     
     # Step 4: Test specific profile if provided
-    profile_to_test = args.profile_id or config_profile_id
-    
-    if profile_to_test and profile_to_test != 'YOUR_PROFILE_ID_HERE':
+    if profile_to_test:
         print_header("Step 3: Testing Specific Profile Access")
-        success, error, profile_data = test_specific_profile(access_token, region, profile_to_test)
+        if profile_check is not None:
+            _announce_profiles_check(region, profile_to_test)
+            success, error, profile_data = _profiles_result(profile_check, profile_to_test)
+        else:
+            success, error, profile_data = test_specific_profile(auth_headers, region, profile_to_test)
         
         if not success:
             print_error(f"Profile access test failed: {error}")
@@ -337,10 +616,13 @@ def main():
     
     # Final summary
     print_header("Connection Test Summary")
-    print_success("✅ OAuth authentication successful")
+    if cached:
+        print_warning("⚠️  OAuth not re-verified (cached access token)")
+    else:
+        print_success("✅ OAuth authentication successful")
     print_success("✅ Profiles API accessible")
     
-    if profile_to_test and profile_to_test != 'YOUR_PROFILE_ID_HERE':
+    if profile_to_test:
         print_success("✅ Profile access verified")
     
     print()
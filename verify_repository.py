@@ -4,7 +4,7 @@ Repository Verification Script
 Comprehensive functionality testing for PPC Upload repository
 
 This script verifies:
-1. All ZIP files can be extracted
+1. All ZIP files are readable (CRC-checked without extracting)
 2. Python scripts have valid syntax
 3. Configuration files are valid JSON/YAML
 4. Dependencies are correctly specified
@@ -16,54 +16,165 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import os
 import sys
+import threading
 import zipfile
-from pathlib import Path
+from collections import deque
+from pathlib import Path, PurePosixPath
 import subprocess
 import tempfile
-from typing import List, Dict, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Tuple
+
+try:  # Optional: faster JSON parsing
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    import yaml
+    YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)  # libyaml when available
+except ImportError:
+    yaml = None
 
 # Constants
 MAX_ALLOWED_ERRORS = 5  # Maximum Python syntax errors before marking as failed
 TEST_TIMEOUT_SECONDS = 30  # Timeout for test script execution
-EXCLUDED_JSON_PATTERNS = ['package.json', 'package-lock.json']  # JSON files to skip validation
+TEST_OUTPUT_TAIL_LINES = 50  # Lines of test output kept for reporting
+EXCLUDED_JSON_NAMES = frozenset({'package.json', 'package-lock.json'})  # JSON files to skip validation
+MAX_ZIP_WORKERS = 8  # Concurrent ZIP scans (zlib releases the GIL)
+MAX_TEST_WORKERS = 4  # Concurrent test scripts (threads just wait on child processes)
+SERIAL_TEST_SCRIPTS = {'test_amazon_connection.py'}  # Hit rate-limited live APIs; never run in parallel
+PROCESS_POOL_MIN_FILES = 32  # Below this, process spawn costs more than compiling serially
+
+# Color codes for terminal output, left out when stdout is redirected
+_COLOR = sys.stdout.isatty()
+GREEN = '\033[92m' if _COLOR else ''
+RED = '\033[91m' if _COLOR else ''
+YELLOW = '\033[93m' if _COLOR else ''
+BLUE = '\033[94m' if _COLOR else ''
+RESET = '\033[0m' if _COLOR else ''
 
-# Color codes for terminal output
-GREEN = '\033[92m'
-RED = '\033[91m'
-YELLOW = '\033[93m'
-BLUE = '\033[94m'
-RESET = '\033[0m'
+# Message framing, built once instead of on every call
+_SUCCESS = f"{GREEN}✅ "
+_ERROR = f"{RED}❌ "
+_WARNING = f"{YELLOW}⚠️  "
+_INFO = f"{BLUE}ℹ️  "
+_END = f"{RESET}\n"
+_HEADER = f"\n{BLUE}{'=' * 70}\n"
+_HEADER_END = f"\n{'=' * 70}{RESET}\n\n"
 
 def print_header(text: str):
     """Print a formatted header"""
-    print(f"\n{BLUE}{'=' * 70}")
-    print(f"{text}")
-    print(f"{'=' * 70}{RESET}\n")
+    sys.stdout.write(_HEADER + text + _HEADER_END)
 
 def print_success(text: str):
     """Print success message"""
-    print(f"{GREEN}✅ {text}{RESET}")
+    sys.stdout.write(_SUCCESS + text + _END)
 
 def print_error(text: str):
     """Print error message"""
-    print(f"{RED}❌ {text}{RESET}")
+    sys.stdout.write(_ERROR + text + _END)
 
 def print_warning(text: str):
     """Print warning message"""
-    print(f"{YELLOW}⚠️  {text}{RESET}")
+    sys.stdout.write(_WARNING + text + _END)
 
 def print_info(text: str):
     """Print info message"""
-    print(f"{BLUE}ℹ️  {text}{RESET}")
+    sys.stdout.write(_INFO + text + _END)
+
+# Archive handles opened by the file checks, one per archive in each process
+_open_archives: Dict[str, zipfile.ZipFile] = {}
+# Config parse errors by content key, so duplicates are parsed once per process
+_config_errors: Dict[Tuple[bool, int, bytes], str] = {}
+
+def _read_member(item: Tuple[str, str]) -> Tuple[str, bytes]:
+    """Read one (archive path, member) pair; returns ("<zip stem>/<member>", content)"""
+    zip_path, member = item
+    zip_ref = _open_archives.get(zip_path)
+    if zip_ref is None:
+        zip_ref = _open_archives[zip_path] = zipfile.ZipFile(zip_path, 'r')
+    return f"{Path(zip_path).stem}/{member}", zip_ref.read(member)
+
+def _close_archives():
+    """Close the archive handles this process opened for the file checks"""
+    for zip_ref in _open_archives.values():
+        zip_ref.close()
+    _open_archives.clear()
+
+def _check_python_source(item: Tuple[str, str]) -> Tuple[str, str, str, Optional[int]]:
+    """Compile one Python member; returns (label, status, error, lineno)
+
+    Lives at module level so a process pool can pickle it. Workers get the
+    archive path and member name and read the source themselves.
+    """
+    label, content = _read_member(item)
+    try:
+        try:
+            # compile() decodes bytes itself; no intermediate str copy
+            compile(content, label, 'exec')
+        except SyntaxError:
+            # Undecodable bytes are skipped rather than counted as errors
+            compile(content.decode('utf-8', errors='ignore'), label, 'exec')
+        return label, 'valid', '', None
+    except SyntaxError as e:
+        return label, 'syntax_error', str(e), e.lineno
+    except Exception as e:
+        # Don't count as error - might be non-Python content
+        return label, 'unreadable', str(e), None
+
+def _validate_config_source(item: Tuple[str, str]) -> Tuple[str, str]:
+    """Parse one JSON or YAML member; returns (label, error), error empty when valid"""
+    label, content = _read_member(item)
+    is_json = label.endswith('.json')
+    # Identical files shipped in several archives are parsed only once
+    key = (is_json, len(content), hashlib.blake2b(content, digest_size=16).digest())
+    if key not in _config_errors:
+        try:
+            if is_json:
+                json_loads(content)
+            else:
+                yaml.load(content.decode('utf-8'), Loader=YAML_LOADER)
+            _config_errors[key] = ''
+        except Exception as e:
+            _config_errors[key] = str(e)
+    return label, _config_errors[key]
+
+def _map_files(func, items: List, chunksize: int = 8) -> List:
+    """Apply func to items, on a process pool once there are enough of them"""
+    if len(items) < PROCESS_POOL_MIN_FILES:
+        return list(map(func, items))
+    # Forked workers must not share the parent's archive file offsets
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_open_archives.clear) as executor:
+        return list(executor.map(func, items, chunksize=chunksize))
+
+def _member_kinds(member: str) -> List[str]:
+    """File-index buckets an archive member belongs to"""
+    name = PurePosixPath(member).name
+    if name.endswith('.py'):
+        return ['py', 'test_py'] if name.startswith('test_') else ['py']
+    if name.endswith('.json'):
+        return ['json']
+    if name.endswith(('.yaml', '.yml')):
+        return ['yaml']
+    return []
 
 class RepositoryVerifier:
     def __init__(self, repo_path: str, verbose: bool = False):
         self.repo_path = Path(repo_path)
         self.verbose = verbose
         self.temp_dir = None
+        # Readable archives, kept open for the whole run
+        self.archives: Dict[Path, zipfile.ZipFile] = {}
+        # (archive, member) pairs bucketed by kind in one pass over each archive
+        self._file_index: Dict[str, List[Tuple[Path, str]]] = {
+            'py': [], 'json': [], 'yaml': [], 'test_py': []
+        }
         self.results = {
             'zip_files': [],
             'python_scripts': [],
@@ -82,27 +193,28 @@ class RepositoryVerifier:
         if not self.verify_repository_structure():
             all_passed = False
         
-        # 2. Create temp directory for extraction
-        self.temp_dir = tempfile.mkdtemp()
-        print_info(f"Created temporary directory: {self.temp_dir}")
-        
-        # 3. Verify ZIP files
-        if not self.verify_zip_files():
-            all_passed = False
-        
-        # 4. Verify Python scripts
-        if not self.verify_python_scripts():
-            all_passed = False
-        
-        # 5. Verify configuration files
-        if not self.verify_config_files():
-            all_passed = False
-        
-        # 6. Run test scripts
-        if not self.run_test_scripts():
-            all_passed = False
+        try:
+            # 2. Verify ZIP files
+            if not self.verify_zip_files():
+                all_passed = False
+            
+            # 3. Verify Python scripts
+            if not self.verify_python_scripts():
+                all_passed = False
+            
+            # 4. Verify configuration files
+            if not self.verify_config_files():
+                all_passed = False
+            
+            # 5. Run test scripts
+            if not self.run_test_scripts():
+                all_passed = False
+        finally:
+            for zip_ref in self.archives.values():
+                zip_ref.close()
+            _close_archives()
         
-        # 7. Generate summary
+        # 6. Generate summary
         self.print_summary()
         
         return all_passed
@@ -132,48 +244,80 @@ class RepositoryVerifier:
         return True
     
     def verify_zip_files(self) -> bool:
-        """Verify all ZIP files can be extracted"""
+        """Verify all ZIP files are readable, without extracting them"""
         print_header("Step 2: ZIP File Verification")
         
         zip_files = list(self.repo_path.glob("*.zip"))
+        if not zip_files:
+            return True
+        
         all_valid = True
         
-        for zip_file in zip_files:
-            try:
-                print_info(f"Extracting: {zip_file.name}")
-                
-                extract_path = Path(self.temp_dir) / zip_file.stem
-                extract_path.mkdir(exist_ok=True)
+        # Scan concurrently; results are recorded here on the main thread
+        with ThreadPoolExecutor(max_workers=min(MAX_ZIP_WORKERS, len(zip_files))) as executor:
+            for zip_file, (result, zip_ref) in zip(zip_files, executor.map(self._scan_one, zip_files)):
+                self.results['zip_files'].append(result)
                 
-                with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-                    file_count = len(zip_ref.namelist())
-                    zip_ref.extractall(extract_path)
-                
-                print_success(f"{zip_file.name}: {file_count} files extracted")
-                self.results['zip_files'].append({
-                    'name': zip_file.name,
-                    'status': 'valid',
-                    'file_count': file_count
-                })
-                
-            except Exception as e:
-                print_error(f"{zip_file.name}: Extraction failed - {str(e)}")
-                all_valid = False
-                self.results['zip_files'].append({
-                    'name': zip_file.name,
-                    'status': 'error',
-                    'error': str(e)
-                })
-                self.results['issues'].append(f"ZIP extraction failed: {zip_file.name}")
+                if result['status'] == 'valid':
+                    self.archives[zip_file] = zip_ref
+                    self._index_members(zip_file, zip_ref.namelist())
+                    print_success(f"{zip_file.name}: {result['file_count']} files verified")
+                else:
+                    print_error(f"{zip_file.name}: Verification failed - {result['error']}")
+                    all_valid = False
+                    self.results['issues'].append(f"ZIP verification failed: {zip_file.name}")
         
         return all_valid
     
+    def _scan_one(self, zip_file: Path) -> Tuple[Dict, Optional[zipfile.ZipFile]]:
+        """Check a ZIP's CRCs from its headers; returns the archive, left open, when valid"""
+        zip_ref = None
+        try:
+            print_info(f"Scanning: {zip_file.name}")
+            
+            zip_ref = zipfile.ZipFile(zip_file, 'r')
+            bad_member = zip_ref.testzip()
+            
+            if bad_member is not None:
+                raise zipfile.BadZipFile(f"CRC check failed for {bad_member}")
+            
+            result = {
+                'name': zip_file.name,
+                'status': 'valid',
+                'file_count': len(zip_ref.namelist())
+            }
+            return result, zip_ref
+            
+        except Exception as e:
+            if zip_ref is not None:
+                zip_ref.close()
+            return {
+                'name': zip_file.name,
+                'status': 'error',
+                'error': str(e)
+            }, None
+    
+    def _index_members(self, zip_file: Path, names: List[str]):
+        """Bucket an archive's file members for the later steps"""
+        for member in names:
+            if member.endswith('/'):
+                continue
+            for kind in _member_kinds(member):
+                self._file_index[kind].append((zip_file, member))
+    
+    def _members(self, kind: str) -> List[Tuple[str, str]]:
+        """One file-index bucket as picklable (archive path, member) pairs
+
+        Nothing is read here; the checks read each member where they run.
+        """
+        return [(str(zip_file), member) for zip_file, member in self._file_index[kind]]
+    
     def verify_python_scripts(self) -> bool:
         """Verify Python script syntax"""
         print_header("Step 3: Python Script Verification")
         
-        # Find all Python files
-        py_files = list(Path(self.temp_dir).rglob("*.py"))
+        # Python files are read straight from the archives by the checks
+        py_files = self._members('py')
         
         if not py_files:
             print_warning("No Python files found")
@@ -185,39 +329,36 @@ class RepositoryVerifier:
         valid_count = 0
         error_count = 0
         
-        for py_file in py_files:
-            try:
-                # Try to compile the Python file
-                with open(py_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    compile(content, str(py_file), 'exec')
-                
+        # compile() is CPU-bound under the GIL, so spread large batches over cores
+        checks = _map_files(_check_python_source, py_files, chunksize=16)
+        
+        for label, status, error, lineno in checks:
+            name = PurePosixPath(label).name
+            if status == 'valid':
                 if self.verbose:
-                    print_success(f"{py_file.name}: Syntax valid")
+                    print_success(f"{name}: Syntax valid")
                 
                 valid_count += 1
                 self.results['python_scripts'].append({
-                    'name': str(py_file.relative_to(self.temp_dir)),
+                    'name': label,
                     'status': 'valid'
                 })
                 
-            except SyntaxError as e:
-                print_error(f"{py_file.name}: SyntaxError at line {e.lineno}")
+            elif status == 'syntax_error':
+                print_error(f"{name}: SyntaxError at line {lineno}")
                 if self.verbose:
-                    print_error(f"  Details: {str(e)}")
+                    print_error(f"  Details: {error}")
                 error_count += 1
                 all_valid = False
                 self.results['python_scripts'].append({
-                    'name': str(py_file.relative_to(self.temp_dir)),
+                    'name': label,
                     'status': 'syntax_error',
-                    'error': str(e)
+                    'error': error
                 })
-                self.results['issues'].append(f"Python syntax error: {py_file.name}")
+                self.results['issues'].append(f"Python syntax error: {name}")
                 
-            except Exception as e:
-                if self.verbose:
-                    print_warning(f"{py_file.name}: {str(e)}")
-                # Don't count as error - might be non-Python content
+            elif self.verbose:
+                print_warning(f"{name}: {error}")
         
         print_info(f"Valid: {valid_count}, Errors: {error_count}")
         
@@ -235,49 +376,38 @@ class RepositoryVerifier:
         all_valid = True
         
         # Check JSON files
-        json_files = list(Path(self.temp_dir).rglob("*.json"))
+        json_files = self._members('json')
         # Exclude certain JSON files that are validated separately
-        json_files = [f for f in json_files if not any(pattern in str(f) for pattern in EXCLUDED_JSON_PATTERNS)]
-        
-        for json_file in json_files:
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                print_success(f"{json_file.name}: Valid JSON")
-                self.results['config_files'].append({
-                    'name': str(json_file.relative_to(self.temp_dir)),
-                    'type': 'json',
-                    'status': 'valid'
-                })
-                
-            except Exception as e:
-                print_error(f"{json_file.name}: Invalid JSON - {str(e)}")
-                all_valid = False
-                self.results['issues'].append(f"Invalid JSON: {json_file.name}")
+        json_files = [f for f in json_files if PurePosixPath(f[1]).name not in EXCLUDED_JSON_NAMES]
         
         # Check YAML files
-        yaml_files = list(Path(self.temp_dir).rglob("*.yaml")) + list(Path(self.temp_dir).rglob("*.yml"))
-        
-        for yaml_file in yaml_files:
-            try:
-                import yaml
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                
-                print_success(f"{yaml_file.name}: Valid YAML")
-                self.results['config_files'].append({
-                    'name': str(yaml_file.relative_to(self.temp_dir)),
-                    'type': 'yaml',
-                    'status': 'valid'
-                })
-                
-            except ImportError:
-                print_warning(f"{yaml_file.name}: PyYAML not installed, skipping")
-            except Exception as e:
-                print_error(f"{yaml_file.name}: Invalid YAML - {str(e)}")
+        if yaml is None:
+            for _, member in self._file_index['yaml']:
+                print_warning(f"{PurePosixPath(member).name}: PyYAML not installed, skipping")
+            yaml_files = []
+        else:
+            yaml_files = self._members('yaml')
+        
+        # Parse JSON and YAML files together in one batch
+        checks = _map_files(_validate_config_source, json_files + yaml_files)
+        
+        for label, error in checks:
+            name = PurePosixPath(label).name
+            file_type = 'json' if label.endswith('.json') else 'yaml'
+            kind = file_type.upper()
+            
+            if error:
+                print_error(f"{name}: Invalid {kind} - {error}")
                 all_valid = False
-                self.results['issues'].append(f"Invalid YAML: {yaml_file.name}")
+                self.results['issues'].append(f"Invalid {kind}: {name}")
+                continue
+            
+            print_success(f"{name}: Valid {kind}")
+            self.results['config_files'].append({
+                'name': label,
+                'type': file_type,
+                'status': 'valid'
+            })
         
         return all_valid
     
@@ -286,108 +416,167 @@ class RepositoryVerifier:
         print_header("Step 5: Running Test Scripts")
         
         # Find test scripts
-        test_files = list(Path(self.temp_dir).rglob("test_*.py"))
+        test_archives: Dict[Path, List[str]] = {}
+        for zip_file, member in self._file_index['test_py']:
+            test_archives.setdefault(zip_file, []).append(member)
         
-        if not test_files:
+        if not test_archives:
             print_info("No test scripts found")
             return True
         
+        # Scripts run as real files, so archives that ship tests go to disk whole
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.temp_dir = temp_dir
+            try:
+                return self._run_extracted_tests(test_archives)
+            finally:
+                self.temp_dir = None
+    
+    def _run_extracted_tests(self, test_archives: Dict[Path, List[str]]) -> bool:
+        """Extract each archive that ships tests into temp_dir and run its test scripts"""
+        test_files = []
+        for zip_file, tests in test_archives.items():
+            extract_path = Path(self.temp_dir) / zip_file.stem
+            # Tests may import packages or open fixtures anywhere in the archive
+            self.archives[zip_file].extractall(extract_path)
+            test_files.extend(extract_path / member for member in tests)
+        
         all_passed = True
         
-        for test_file in test_files:
-            try:
+        max_workers = min(MAX_TEST_WORKERS, len(test_files))
+        if any(test_file.name in SERIAL_TEST_SCRIPTS for test_file in test_files):
+            max_workers = 1
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for test_file in test_files:
                 print_info(f"Running: {test_file.name}")
-                
-                result = subprocess.run(
-                    [sys.executable, str(test_file)],
-                    cwd=test_file.parent,
-                    capture_output=True,
-                    text=True,
-                    timeout=TEST_TIMEOUT_SECONDS
-                )
-                
-                if result.returncode == 0:
-                    print_success(f"{test_file.name}: All tests passed")
-                    if self.verbose:
-                        print(result.stdout)
-                    
-                    self.results['test_results'].append({
-                        'name': str(test_file.relative_to(self.temp_dir)),
-                        'status': 'passed',
-                        'output': result.stdout
-                    })
-                else:
-                    print_error(f"{test_file.name}: Tests failed")
-                    if self.verbose:
-                        print(result.stderr)
-                    
+                futures[executor.submit(self._run_test, test_file)] = test_file
+            
+            # Report each script as soon as it finishes
+            for future in as_completed(futures):
+                test_file = futures[future]
+                if not self._record_test_result(test_file, future):
                     all_passed = False
-                    self.results['test_results'].append({
-                        'name': str(test_file.relative_to(self.temp_dir)),
-                        'status': 'failed',
-                        'error': result.stderr
-                    })
-                    self.results['issues'].append(f"Test failed: {test_file.name}")
-                    
-            except subprocess.TimeoutExpired:
-                print_error(f"{test_file.name}: Timeout")
-                all_passed = False
-                self.results['issues'].append(f"Test timeout: {test_file.name}")
-            except Exception as e:
-                print_error(f"{test_file.name}: Error - {str(e)}")
-                all_passed = False
-                self.results['issues'].append(f"Test error: {test_file.name}")
         
         return all_passed
     
+    def _run_test(self, test_file: Path) -> subprocess.CompletedProcess:
+        """Run one test script in its own directory, keeping only the tail of its output"""
+        args = [sys.executable, str(test_file)]
+        proc = subprocess.Popen(
+            args,
+            cwd=test_file.parent,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
+        
+        # Drain the pipe as lines arrive so the child never blocks on a full buffer
+        tail = deque(maxlen=TEST_OUTPUT_TAIL_LINES)
+        reader = threading.Thread(target=tail.extend, args=(proc.stdout,), daemon=True)
+        reader.start()
+        try:
+            returncode = proc.wait(timeout=TEST_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            reader.join()
+            proc.stdout.close()
+        
+        return subprocess.CompletedProcess(args, returncode, stdout=''.join(tail))
+    
+    def _record_test_result(self, test_file: Path, future) -> bool:
+        """Print and record a finished test script; returns whether it passed"""
+        try:
+            result = future.result()
+        except subprocess.TimeoutExpired:
+            print_error(f"{test_file.name}: Timeout")
+            self.results['issues'].append(f"Test timeout: {test_file.name}")
+            return False
+        except Exception as e:
+            print_error(f"{test_file.name}: Error - {str(e)}")
+            self.results['issues'].append(f"Test error: {test_file.name}")
+            return False
+        
+        if result.returncode == 0:
+            print_success(f"{test_file.name}: All tests passed")
+            if self.verbose:
+                print(result.stdout)
+            
+            self.results['test_results'].append({
+                'name': str(test_file.relative_to(self.temp_dir)),
+                'status': 'passed',
+                'output': result.stdout
+            })
+            return True
+        
+        print_error(f"{test_file.name}: Tests failed")
+        if self.verbose:
+            print(result.stdout)
+        
+        self.results['test_results'].append({
+            'name': str(test_file.relative_to(self.temp_dir)),
+            'status': 'failed',
+            'error': result.stdout
+        })
+        self.results['issues'].append(f"Test failed: {test_file.name}")
+        return False
+    
     def print_summary(self):
-        """Print verification summary"""
-        print_header("Verification Summary")
+        """Print verification summary in a single write"""
+        out = [_HEADER, "Verification Summary", _HEADER_END]
         
         # ZIP files
         zip_count = len(self.results['zip_files'])
         zip_valid = sum(1 for z in self.results['zip_files'] if z['status'] == 'valid')
-        print(f"ZIP Files: {zip_valid}/{zip_count} valid")
+        out.append(f"ZIP Files: {zip_valid}/{zip_count} valid\n")
         
         # Python scripts
         py_count = len(self.results['python_scripts'])
         py_valid = sum(1 for p in self.results['python_scripts'] if p['status'] == 'valid')
         py_errors = py_count - py_valid
-        print(f"Python Scripts: {py_valid}/{py_count} valid")
+        out.append(f"Python Scripts: {py_valid}/{py_count} valid\n")
         if py_errors > 0:
-            print_warning(f"  {py_errors} scripts have syntax errors")
+            out += [_WARNING, f"  {py_errors} scripts have syntax errors", _END]
         
         # Config files
         config_count = len(self.results['config_files'])
         config_valid = sum(1 for c in self.results['config_files'] if c['status'] == 'valid')
-        print(f"Config Files: {config_valid}/{config_count} valid")
+        out.append(f"Config Files: {config_valid}/{config_count} valid\n")
         
         # Test results
         test_count = len(self.results['test_results'])
         test_passed = sum(1 for t in self.results['test_results'] if t['status'] == 'passed')
         if test_count > 0:
-            print(f"Test Scripts: {test_passed}/{test_count} passed")
+            out.append(f"Test Scripts: {test_passed}/{test_count} passed\n")
         
         # Issues
-        print(f"\nTotal Issues: {len(self.results['issues'])}")
+        out.append(f"\nTotal Issues: {len(self.results['issues'])}\n")
         
         if self.results['issues']:
-            print("\nIssues Found:")
-            for issue in self.results['issues']:
-                print_warning(f"  • {issue}")
+            out.append("\nIssues Found:\n")
+            out += [f"{_WARNING}  • {issue}{_END}" for issue in self.results['issues']]
         
         # Overall status
-        print()
+        out.append("\n")
         if len(self.results['issues']) == 0:
-            print_success("✅ ALL VERIFICATIONS PASSED")
-            return True
+            out += [_SUCCESS, "✅ ALL VERIFICATIONS PASSED", _END]
+            passed = True
         elif py_errors <= MAX_ALLOWED_ERRORS:  # Allow some v2 errors
-            print_warning("⚠️  MOSTLY FUNCTIONAL (minor issues found)")
-            print_info("Production v1 scripts are fully functional")
-            return True
+            out += [_WARNING, "⚠️  MOSTLY FUNCTIONAL (minor issues found)", _END]
+            out += [_INFO, "Production v1 scripts are fully functional", _END]
+            passed = True
         else:
-            print_error("❌ VERIFICATION FAILED")
-            return False
+            out += [_ERROR, "❌ VERIFICATION FAILED", _END]
+            passed = False
+        
+        sys.stdout.write(''.join(out))
+        sys.stdout.flush()
+        return passed
 
 def main():
     parser = argparse.ArgumentParser(